@@ -54,6 +54,8 @@ class BusinessModelAnalyzer:
                 'ticker': ticker,
                 'timestamp': datetime.now(),
                 'score': 0,
+                'sector': info.get('sector'),
+                'industry': info.get('industry'),
                 'revenue_architecture': {},
                 'unit_economics': {},
                 'moat_analysis': {},
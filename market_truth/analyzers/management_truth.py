@@ -21,15 +21,108 @@ Red Flags:
 from src.yfinance_helper import yf_helper
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import logging
+import random
 import time
 import sys
 import os
 
-# Import SEC client
+# Make src/ importable
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from src.sec_edgar_client import SECEdgarClient
+
+from market_truth.core.api_manager import get_api_manager
+from market_truth.core.disk_cache import DiskCache
+from market_truth.core.jit import njit
+
+logger = logging.getLogger(__name__)
+
+# Finished analyses are keyed by date, so they never outlive the day
+RESULT_CACHE_TTL = 86400
+
+# Upper bound (seconds) for the yfinance retry backoff
+MAX_BACKOFF = 30
+
+# yfinance info fields reported as fractions (0.05 = 5%)
+OWNERSHIP_FIELDS: Tuple[str, ...] = ('heldPercentInsiders', 'heldPercentInstitutions')
+QUALITY_FIELDS: Tuple[str, ...] = ('returnOnEquity', 'returnOnAssets', 'profitMargins', 'operatingMargins')
+
+# Sub-analyses whose flags roll up into the layer result
+_CATEGORIES: Tuple[str, ...] = ('insider_ownership', 'insider_transactions', 'compensation', 'management_quality')
+_FLAG_KEYS: Tuple[str, ...] = ('red_flags', 'green_flags', 'warnings')
+
+
+def _pct_fields(info: Dict, fields: Tuple[str, ...]) -> Dict[str, Optional[float]]:
+    """Read fractional info fields as percentages in one pass (None if missing)"""
+    return {field: info[field] * 100 if info.get(field) is not None else None
+            for field in fields}
+
+
+def _is_ceo(title: str) -> bool:
+    """True if an officer title names the chief executive"""
+    title = title.upper()
+    return 'CEO' in title or 'CHIEF EXECUTIVE' in title
+
+
+def _find_ceo(officers: List[Dict]) -> Optional[Dict]:
+    """Return the first officer whose title names them chief executive"""
+    return next((officer for officer in officers
+                 if officer.get('title') and _is_ceo(officer['title'])), None)
+
+
+# Score ladders: points[i] applies below thresholds[i], points[-1] above the last
+_INSIDER_THRESH = np.array([1.0, 5.0, 10.0, 20.0])
+_INSIDER_POINTS = np.array([-1, 0, 1, 2, 3])
+_ROE_THRESH = np.array([10.0, 15.0, 20.0])
+_ROE_POINTS = np.array([-1, 0, 1, 2])
+_MARGIN_THRESH = np.array([5.0, 20.0])
+_MARGIN_POINTS = np.array([-1, 0, 1])
+
+
+@njit(cache=True)
+def _ladder_points(value: float, thresholds: np.ndarray, points: np.ndarray) -> int:
+    """
+    Look up the score points for value on a sorted threshold ladder
+
+    Values below thresholds[0] get points[0]; values above thresholds[i]
+    get points[i + 1]. Both ends are strict comparisons, so a value sitting
+    exactly on thresholds[0] belongs to the band above it.
+    """
+    idx = np.searchsorted(thresholds, value, side='left')
+    if idx == 0 and value == thresholds[0]:
+        idx = 1
+    return int(points[idx])
+
+
+@njit(cache=True)
+def _score_kernel(insider_pct: float, roe: float, profit_margin: float,
+                  n_green: int, n_red: int) -> int:
+    """
+    Numeric core of the management score (0-10)
+
+    Metrics are percentages with 0.0 meaning "not available".
+    """
+    score = 5  # Start neutral
+
+    # Insider Ownership (0-3 points)
+    if insider_pct != 0:
+        score += _ladder_points(insider_pct, _INSIDER_THRESH, _INSIDER_POINTS)
+
+    # Management Performance (0-5 points)
+    if roe > 0:
+        score += _ladder_points(roe, _ROE_THRESH, _ROE_POINTS)
+    if profit_margin > 0:
+        score += _ladder_points(profit_margin, _MARGIN_THRESH, _MARGIN_POINTS)
+
+    # Bonus/penalty for flags
+    score += min(n_green, 2)  # Max +2 for green flags
+    score -= n_red  # -1 for each red flag
+
+    # Cap at 0-10
+    return max(0, min(10, score))
 
 
 class ManagementTruthDetector:
@@ -50,9 +143,11 @@ class ManagementTruthDetector:
         if api_manager and api_manager.sec_client:
             self.sec_client = api_manager.sec_client
         else:
-            # Fallback to creating own client
-            self.sec_client = SECEdgarClient()
-        self.data_quality = 'UNKNOWN'
+            # Fallback to the process-wide API manager's client (SEC fetches go through it too)
+            self.sec_client = get_api_manager().sec_client
+        self.result_cache = DiskCache('management_results', ttl=RESULT_CACHE_TTL)
+        # yfinance DataFrame attributes fetched this session, keyed by (ticker, attr)
+        self._yf_cache: Dict[Tuple[str, str], Any] = {}
 
     def analyze(self, ticker: str) -> Dict:
         """
@@ -60,18 +155,25 @@ class ManagementTruthDetector:
 
         Returns comprehensive analysis with score 0-10
         """
-        print(f"\n{'='*80}")
-        print(f"MANAGEMENT TRUTH DETECTION: {ticker}")
-        print(f"{'='*80}\n")
+        logger.debug("MANAGEMENT TRUTH DETECTION: %s", ticker)
 
         try:
+            # 0. Get SEC filing metadata (PRIMARY SOURCE)
+            logger.debug("Fetching SEC filing data...")
+            sec_data = self.get_sec_filing_data(ticker)
+
+            # Reuse today's result unless a new filing has landed since
+            result_key = self._result_cache_key(ticker, sec_data)
+            cached = self.result_cache.get(result_key)
+            if cached is not None:
+                logger.debug("Using cached analysis (no new SEC filings today)")
+                return cached
+
             # Use API manager if available
             if self.api_manager:
                 stock_data = self.api_manager.get_stock_data(ticker)
                 stock = stock_data['data']
             else:
-                # Add delay to avoid rate limiting
-                time.sleep(1)
                 stock = yf_helper.get_ticker(ticker)
 
             # Try to get info with retry
@@ -84,8 +186,9 @@ class ManagementTruthDetector:
                         break
                 except Exception as e:
                     if attempt < max_retries - 1:
-                        wait_time = (attempt + 1) * 2  # 2, 4, 6 seconds
-                        print(f"Rate limit, waiting {wait_time}s... (attempt {attempt + 1}/{max_retries})")
+                        # Exponential backoff with jitter so parallel runs don't retry in lockstep
+                        wait_time = min(MAX_BACKOFF, 2 ** (attempt + 1)) + random.random()
+                        logger.debug("Rate limit, waiting %.1fs... (attempt %d/%d)", wait_time, attempt + 1, max_retries)
                         time.sleep(wait_time)
                     else:
                         raise
@@ -93,9 +196,24 @@ class ManagementTruthDetector:
             if not info:
                 raise ValueError("Could not retrieve ticker info")
 
+            # Nothing to analyze: no SEC filings and no ownership/performance data
+            has_any = (sec_data.get('has_data')
+                       or info.get('heldPercentInsiders') is not None
+                       or info.get('returnOnEquity') is not None)
+            if not has_any:
+                logger.debug("No SEC filings or ownership data - skipping sub-analyses")
+                return {
+                    'ticker': ticker,
+                    'score': 0,
+                    'error': 'no_data',
+                    'red_flags': ['NO_DATA'],
+                    'data_quality': sec_data.get('data_quality', 'NO_DATA')
+                }
+
             analysis = {
                 'ticker': ticker,
-                'timestamp': datetime.now(),
+                # ISO string, the same form a cached result comes back in
+                'timestamp': datetime.now().isoformat(),
                 'score': 0,
                 'insider_ownership': {},
                 'insider_transactions': {},
@@ -109,51 +227,53 @@ class ManagementTruthDetector:
                 'data_sources': []
             }
 
-            # 0. Get SEC filing metadata (PRIMARY SOURCE)
-            print("Fetching SEC filing data...")
-            sec_data = self.get_sec_filing_data(ticker)
+            # Per call, not instance state: analyze() runs concurrently for many tickers
+            data_quality = 'UNKNOWN'
             analysis['sec_filings'] = sec_data
             if sec_data.get('has_data'):
                 analysis['data_sources'].append('SEC_EDGAR')
-                self.data_quality = 'PRIMARY'
+                data_quality = 'PRIMARY'
 
             # 1. Insider Ownership Analysis
-            print("Analyzing insider ownership...")
+            logger.debug("Analyzing insider ownership...")
             ownership = self.analyze_insider_ownership(stock, info)
             analysis['insider_ownership'] = ownership
 
             # 2. Insider Transaction Analysis (SEC PRIMARY, yfinance FALLBACK)
-            print("Analyzing insider transactions...")
+            logger.debug("Analyzing insider transactions...")
             transactions = self.analyze_insider_transactions_multi_source(ticker, stock, info, sec_data)
             analysis['insider_transactions'] = transactions
 
             # 3. Compensation Analysis (limited public data)
-            print("Analyzing compensation structure...")
+            logger.debug("Analyzing compensation structure...")
             compensation = self.analyze_compensation(stock, info)
             analysis['compensation'] = compensation
 
             # 4. Management Quality Indicators
-            print("Assessing management quality...")
+            logger.debug("Assessing management quality...")
             quality = self.assess_management_quality(stock, info)
             analysis['management_quality'] = quality
 
             # Calculate score
             score = self._calculate_score(analysis)
             analysis['score'] = score
-            analysis['data_quality'] = self.data_quality
+            analysis['data_quality'] = data_quality
 
             # Add data source summary
-            if 'yfinance' not in [s.lower() for s in analysis['data_sources']]:
+            if not any(s.lower() == 'yfinance' for s in analysis['data_sources']):
                 analysis['data_sources'].append('yfinance')
 
-            print(f"\nManagement Truth Score: {score}/10")
-            print(f"Data Quality: {self.data_quality}")
-            print(f"Data Sources: {', '.join(analysis['data_sources'])}")
+            logger.debug("Management Truth Score: %s/10", score)
+            logger.debug("Data Quality: %s", data_quality)
+            logger.debug("Data Sources: %s", ', '.join(analysis['data_sources']))
+
+            if sec_data.get('has_data'):
+                self.result_cache.set(result_key, analysis)
 
             return analysis
 
         except Exception as e:
-            print(f"Error analyzing {ticker}: {e}")
+            logger.warning("Error analyzing %s: %s", ticker, e)
             return {
                 'ticker': ticker,
                 'score': 0,
@@ -161,6 +281,21 @@ class ManagementTruthDetector:
                 'red_flags': ['ANALYSIS_FAILED']
             }
 
+    def _result_cache_key(self, ticker: str, sec_data: Dict) -> str:
+        """
+        Cache key for a finished analysis: ticker + today + latest filing dates
+
+        A new 10-K, proxy, or Form 4 changes the key and forces a fresh run.
+        """
+        insider_filings = sec_data.get('insider_filings') or [{}]
+        filing_dates = '|'.join([
+            str((sec_data.get('latest_10k') or {}).get('filing_date', '')),
+            str((sec_data.get('latest_proxy') or {}).get('filing_date', '')),
+            str(insider_filings[0].get('filing_date', ''))
+        ])
+        digest = hashlib.md5(filing_dates.encode()).hexdigest()[:12]
+        return f"{ticker}_{date.today().isoformat()}_{digest}"
+
     def get_sec_filing_data(self, ticker: str) -> Dict:
         """
         Get SEC filing metadata for management analysis
@@ -175,14 +310,15 @@ class ManagementTruthDetector:
             }
         """
         try:
-            # Get latest proxy (DEF 14A) - contains exec comp data
-            proxy = self.sec_client.get_latest_proxy(ticker)
-
-            # Get latest 10-K - contains business context
-            filing_10k = self.sec_client.get_latest_10k(ticker)
+            # The API manager fetches the proxy (DEF 14A, exec comp), latest 10-K
+            # (business context) and Form 4s under the SEC rate limit, cached on disk
+            sec = (self.api_manager or get_api_manager()).get_sec_data(ticker)
+            if sec.get('error'):
+                raise RuntimeError(sec['error'])
 
-            # Get insider transactions (Form 4)
-            insider_filings = self.sec_client.get_insider_transactions(ticker, days_back=180)
+            proxy = sec.get('latest_proxy')
+            filing_10k = sec.get('latest_10k')
+            insider_filings = sec.get('insider_filings') or []
 
             has_data = bool(proxy or filing_10k or insider_filings)
 
@@ -195,7 +331,7 @@ class ManagementTruthDetector:
             }
 
             # Assess data quality based on filing dates
-            if filing_10k:
+            if filing_10k and self.sec_client:
                 result['data_quality'] = self.sec_client.validate_data_quality(
                     filing_10k.get('filing_date', '')
                 )
@@ -205,7 +341,7 @@ class ManagementTruthDetector:
             return result
 
         except Exception as e:
-            print(f"Error fetching SEC data: {e}")
+            logger.warning("Error fetching SEC data: %s", e)
             return {
                 'has_data': False,
                 'error': str(e),
@@ -258,6 +394,22 @@ class ManagementTruthDetector:
 
         return analysis
 
+    def _get_yf_attr(self, stock, attr: str) -> Any:
+        """
+        Read a yfinance Ticker attribute once per session
+
+        Attributes like major_holders and insider_transactions trigger an
+        HTTP fetch on access, so re-analyzing a ticker reuses the first result.
+        """
+        ticker = getattr(stock, 'ticker', None)
+        if ticker is None:
+            return getattr(stock, attr)
+
+        key = (ticker, attr)
+        if key not in self._yf_cache:
+            self._yf_cache[key] = getattr(stock, attr)
+        return self._yf_cache[key]
+
     def analyze_insider_ownership(self, stock, info: Dict) -> Dict:
         """
         Analyze insider ownership percentages
@@ -282,11 +434,11 @@ class ManagementTruthDetector:
 
         try:
             # Get ownership data
-            held_by_insiders = info.get('heldPercentInsiders')
-            held_by_institutions = info.get('heldPercentInstitutions')
+            pct = _pct_fields(info, OWNERSHIP_FIELDS)
+            insider_pct = pct['heldPercentInsiders']
+            inst_pct = pct['heldPercentInstitutions']
 
-            if held_by_insiders is not None:
-                insider_pct = held_by_insiders * 100
+            if insider_pct is not None:
                 analysis['insider_pct'] = round(insider_pct, 2)
 
                 # Flags based on insider ownership
@@ -297,8 +449,7 @@ class ManagementTruthDetector:
                 elif insider_pct < 1:
                     analysis['red_flags'].append('LOW_INSIDER_OWNERSHIP')
 
-            if held_by_institutions is not None:
-                inst_pct = held_by_institutions * 100
+            if inst_pct is not None:
                 analysis['institutional_pct'] = round(inst_pct, 2)
 
                 # High institutional = professional money believes in it
@@ -319,10 +470,11 @@ class ManagementTruthDetector:
 
             # Get major holders info
             try:
-                major_holders = stock.major_holders
+                major_holders = self._get_yf_attr(stock, 'major_holders')
                 if major_holders is not None and not major_holders.empty:
-                    # major_holders is typically a 2-column df with % and description
-                    analysis['major_holders_data'] = major_holders.to_dict()
+                    # major_holders is a small 2-column df with % and description;
+                    # keep the rows as plain lists instead of a nested to_dict()
+                    analysis['major_holders_data'] = major_holders.to_numpy().tolist()
             except:
                 pass
 
@@ -358,14 +510,15 @@ class ManagementTruthDetector:
 
             # Check if there's any insider info available
             try:
-                insider_transactions = stock.insider_transactions
+                insider_transactions = self._get_yf_attr(stock, 'insider_transactions')
                 if insider_transactions is not None and not insider_transactions.empty:
                     # Analyze recent transactions (last 6 months)
-                    recent = insider_transactions.head(20)  # Get recent transactions
+                    recent_count = min(len(insider_transactions), 20)  # Get recent transactions
 
                     # Count buys vs sells
-                    if 'Shares' in recent.columns:
-                        total_shares = recent['Shares'].sum()
+                    if 'Shares' in insider_transactions.columns:
+                        shares = insider_transactions['Shares'].to_numpy(dtype=np.float64)[:20]
+                        total_shares = np.nansum(shares)
 
                         if total_shares > 0:
                             analysis['recent_activity'] = f'Net buying: {total_shares:,.0f} shares'
@@ -374,7 +527,7 @@ class ManagementTruthDetector:
                             analysis['recent_activity'] = f'Net selling: {abs(total_shares):,.0f} shares'
                             analysis['warnings'] = analysis.get('warnings', []) + ['INSIDER_SELLING']
 
-                    analysis['transaction_count'] = len(recent)
+                    analysis['transaction_count'] = recent_count
                 else:
                     analysis['note'] = 'No insider transaction data available from yfinance'
 
@@ -419,9 +572,7 @@ class ManagementTruthDetector:
 
                 if officers:
                     # Find CEO
-                    ceo = next((officer for officer in officers
-                               if 'CEO' in officer.get('title', '').upper()
-                               or 'Chief Executive' in officer.get('title', '')), None)
+                    ceo = _find_ceo(officers)
 
                     if ceo:
                         total_pay = ceo.get('totalPay')
@@ -474,10 +625,11 @@ class ManagementTruthDetector:
         }
 
         try:
+            pct = _pct_fields(info, QUALITY_FIELDS)
+
             # Return on Equity - Key management efficiency metric
-            roe = info.get('returnOnEquity')
-            if roe:
-                roe_pct = roe * 100
+            roe_pct = pct['returnOnEquity']
+            if roe_pct:
                 analysis['performance_metrics']['return_on_equity'] = round(roe_pct, 2)
 
                 if roe_pct > 20:  # >20% ROE = excellent capital allocation
@@ -488,18 +640,16 @@ class ManagementTruthDetector:
                     analysis['red_flags'].append('WEAK_ROE')
 
             # Return on Assets
-            roa = info.get('returnOnAssets')
-            if roa:
-                roa_pct = roa * 100
+            roa_pct = pct['returnOnAssets']
+            if roa_pct:
                 analysis['performance_metrics']['return_on_assets'] = round(roa_pct, 2)
 
                 if roa_pct > 10:
                     analysis['green_flags'].append('EFFICIENT_ASSET_USE')
 
             # Profit Margin - Execution quality
-            profit_margin = info.get('profitMargins')
-            if profit_margin:
-                margin_pct = profit_margin * 100
+            margin_pct = pct['profitMargins']
+            if margin_pct:
                 analysis['performance_metrics']['profit_margin'] = round(margin_pct, 2)
 
                 if margin_pct > 20:
@@ -508,9 +658,8 @@ class ManagementTruthDetector:
                     analysis['red_flags'].append('LOW_PROFITABILITY')
 
             # Operating Margin - Core business efficiency
-            operating_margin = info.get('operatingMargins')
-            if operating_margin:
-                op_margin_pct = operating_margin * 100
+            op_margin_pct = pct['operatingMargins']
+            if op_margin_pct:
                 analysis['performance_metrics']['operating_margin'] = round(op_margin_pct, 2)
 
             return analysis
@@ -527,63 +676,26 @@ class ManagementTruthDetector:
         - Insider activity: 0-2 points
         - Management performance: 0-5 points
         """
-        score = 5  # Start neutral
-
-        # Insider Ownership (0-3 points)
         ownership = analysis.get('insider_ownership', {})
-        insider_pct = ownership.get('insider_pct', 0)
-
-        if insider_pct:
-            if insider_pct > 20:
-                score += 3
-            elif insider_pct > 10:
-                score += 2
-            elif insider_pct > 5:
-                score += 1
-            elif insider_pct < 1:
-                score -= 1
-
-        # Management Performance (0-5 points)
         quality = analysis.get('management_quality', {})
         metrics = quality.get('performance_metrics', {})
 
-        roe = metrics.get('return_on_equity', 0)
-        if roe > 20:
-            score += 2
-        elif roe > 15:
-            score += 1
-        elif roe < 10 and roe > 0:
-            score -= 1
-
-        profit_margin = metrics.get('profit_margin', 0)
-        if profit_margin > 20:
-            score += 1
-        elif profit_margin < 5 and profit_margin > 0:
-            score -= 1
-
         # Collect all flags
-        all_red_flags = []
-        all_green_flags = []
-        all_warnings = []
-
-        for category in ['insider_ownership', 'insider_transactions', 'compensation', 'management_quality']:
-            if category in analysis:
-                cat_data = analysis[category]
-                if isinstance(cat_data, dict):
-                    all_red_flags.extend(cat_data.get('red_flags', []))
-                    all_green_flags.extend(cat_data.get('green_flags', []))
-                    all_warnings.extend(cat_data.get('warnings', []))
-
-        analysis['red_flags'] = list(set(all_red_flags))
-        analysis['green_flags'] = list(set(all_green_flags))
-        analysis['warnings'] = list(set(all_warnings))
-
-        # Bonus/penalty for flags
-        score += min(len(all_green_flags), 2)  # Max +2 for green flags
-        score -= len(all_red_flags)  # -1 for each red flag
-
-        # Cap at 0-10
-        return max(0, min(10, score))
+        sections = [analysis[c] for c in _CATEGORIES if isinstance(analysis.get(c), dict)]
+        flags = {key: list(chain.from_iterable(section.get(key, ()) for section in sections))
+                 for key in _FLAG_KEYS}
+
+        # Order-preserving dedup keeps flag output deterministic across runs
+        for key in _FLAG_KEYS:
+            analysis[key] = list(dict.fromkeys(flags[key]))
+
+        return int(_score_kernel(
+            float(ownership.get('insider_pct') or 0),
+            float(metrics.get('return_on_equity') or 0),
+            float(metrics.get('profit_margin') or 0),
+            len(flags['green_flags']),
+            len(flags['red_flags'])
+        ))
 
 
 def main():
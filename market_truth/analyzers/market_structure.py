@@ -24,11 +24,187 @@ Red Flags:
 - Low liquidity = can't exit when you need to
 - Recent secondary offering = dilution
 """
-from src.yfinance_helper import yf_helper
-import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import bisect
+import logging
+import time
+
+import requests
+
+from market_truth.core.disk_cache import DiskCache
+from market_truth.core.jit import njit
+
+logger = logging.getLogger(__name__)
+
+# Price and volume fields in info go stale intraday; reuse a fetch for 15 minutes
+INFO_TTL = 900
+
+# Cross-run copy of info on disk; older entries are re-fetched from Yahoo
+INFO_DISK_TTL = 3600
+_info_disk_cache: Optional[DiskCache] = None
+
+# Transient Yahoo failures (429/5xx) are retried with exponential backoff
+INFO_RETRIES = 3
+INFO_BACKOFF = 0.3
+_TRANSIENT_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# Short % of float buckets: [0, 5), [5, 10), [10, 20), [20, inf)
+_SHORT_BOUNDS = (5, 10, 20)
+_SHORT_INTERPRETATIONS = (
+    'Normal short interest',
+    'Elevated short interest',
+    'High short interest - squeeze potential',
+    'Extreme short interest - investigate why'
+)
+_SHORT_GREEN_FLAGS = (None, 'MODERATE_SHORT_INTEREST', 'SQUEEZE_POTENTIAL', None)
+
+# Average volume buckets: [0, 100K], (100K, 1M], (1M, 10M], (10M, inf)
+_LIQUIDITY_BOUNDS = (100_000, 1_000_000, 10_000_000)
+_LIQUIDITY_RATINGS = ('LOW', 'MODERATE', 'GOOD', 'EXCELLENT')
+_LIQUIDITY_POINTS = dict(zip(_LIQUIDITY_RATINGS, (-2, 1, 2, 3)))
+_LIQUIDITY_FLAGS = (
+    ('red_flags', 'LOW_LIQUIDITY'),
+    ('warnings', 'MODERATE_LIQUIDITY'),
+    None,
+    ('green_flags', 'HIGH_LIQUIDITY')
+)
+
+# info fields read by the batch scorer, one float64 column each
+_BATCH_FIELDS = (
+    'sharesOutstanding', 'floatShares', 'heldPercentInsiders', 'heldPercentInstitutions',
+    'shortPercentOfFloat', 'shortRatio', 'averageVolume', 'marketCap', 'currentPrice'
+)
+_BATCH_DTYPE = np.dtype([(field, np.float64) for field in _BATCH_FIELDS])
+
+# ticker -> (fetched_at, info)
+_info_cache: Dict[str, Tuple[float, Dict]] = {}
+
+# ticker -> (created_at, Ticker). yfinance memoizes info and the options
+# expirations on the Ticker object, so a symbol gets a new one when they are
+# due for a refresh
+TICKER_MEMO_SIZE = 1024
+_tickers: Dict[str, Tuple[float, Any]] = {}
+
+# Shared pool for the stock.options prefetch in analyze(); threads start on first use
+OPTIONS_PREFETCH_WORKERS = 8
+_options_pool = ThreadPoolExecutor(max_workers=OPTIONS_PREFETCH_WORKERS, thread_name_prefix='options-prefetch')
+
+
+def _new_ticker(ticker: str) -> Any:
+    """Create a yfinance Ticker for a symbol and memoize it"""
+    # Deferred so importing this module doesn't pay the yfinance startup cost
+    from src.yfinance_helper import yf_helper
+    stock = yf_helper.get_ticker(ticker)
+    if ticker not in _tickers and len(_tickers) >= TICKER_MEMO_SIZE:
+        _tickers.pop(next(iter(_tickers)), None)
+    _tickers[ticker] = (time.time(), stock)
+    return stock
+
+
+def _get_ticker(ticker: str) -> Any:
+    """Get the memoized yfinance Ticker for a symbol, replaced after INFO_TTL"""
+    memo = _tickers.get(ticker)
+    if memo and time.time() - memo[0] < INFO_TTL:
+        return memo[1]
+    return _new_ticker(ticker)
+
+
+def _is_transient(error: Exception) -> bool:
+    """True for failures worth retrying: connection drops, timeouts, 429 and 5xx responses"""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if status is not None:
+        return status in _TRANSIENT_STATUS
+    # yfinance raises its own rate-limit error without a response attached
+    return type(error).__name__ == 'YFRateLimitError' or 'Too Many Requests' in str(error)
+
+
+def _fetch_info(stock) -> Dict:
+    """Fetch stock.info, retrying transient failures with backoff"""
+    for attempt in range(INFO_RETRIES):
+        try:
+            return stock.info
+        except Exception as e:
+            if attempt == INFO_RETRIES - 1 or not _is_transient(e):
+                raise
+            wait_time = INFO_BACKOFF * 2 ** attempt
+            logger.info("info fetch failed (%s), retrying in %.1fs (attempt %d/%d)",
+                        e, wait_time, attempt + 1, INFO_RETRIES)
+            time.sleep(wait_time)
+
+
+def _get_info_disk_cache() -> DiskCache:
+    """Get the on-disk info cache, created on first use so importing this module writes nothing"""
+    global _info_disk_cache
+    if _info_disk_cache is None:
+        _info_disk_cache = DiskCache('ticker_info', ttl=INFO_DISK_TTL)
+    return _info_disk_cache
+
+
+def _get_cached_stock_and_info(ticker: str) -> Tuple[Any, Dict]:
+    """
+    Get (Ticker, info) for a symbol
+
+    info is the dominant network cost of this layer. Lookup order:
+    in-process copy (INFO_TTL), on-disk copy (INFO_DISK_TTL), then Yahoo.
+    """
+    cached = _info_cache.get(ticker)
+    if cached and time.time() - cached[0] < INFO_TTL:
+        return _get_ticker(ticker), cached[1]
+
+    # Disk entries carry the original fetch time so INFO_TTL still counts from the fetch
+    disk_cache = _get_info_disk_cache()
+    entry = disk_cache.get(ticker)
+    if isinstance(entry, dict) and 'fetched_at' in entry:
+        stock = _get_ticker(ticker)
+        fetched_at, info = entry['fetched_at'], entry['info']
+    else:
+        # A memoized Ticker would hand back its old info without a request
+        stock = _new_ticker(ticker)
+        fetched_at, info = time.time(), _fetch_info(stock)
+        if info:
+            disk_cache.set(ticker, {'fetched_at': fetched_at, 'info': info})
+
+    _info_cache[ticker] = (fetched_at, info)
+    return stock, info
+
+
+def _info_records(info_list: List[Dict]) -> np.ndarray:
+    """Pack the scored info fields of many tickers into one record array (NaN where missing)"""
+    # map(info.get, ...) pulls all fields in one C-level pass; numpy turns None into NaN
+    rows = [tuple(map(info.get, _BATCH_FIELDS)) for info in info_list]
+    return np.array(rows, dtype=_BATCH_DTYPE)
+
+
+@njit(cache=True)
+def _score_kernel(tradeable_float, short_pct, liquidity_points, options_available, n_green, n_red):
+    """
+    Market structure score (0-10) as branchless arithmetic
+
+    A percentage of 0 means missing, like the `if value:` guards it replaces.
+    """
+    score = 5 + liquidity_points + options_available
+
+    # Float: sweet spot 20-60%, low float (<20%) still interesting
+    score += 2 * (20 < tradeable_float < 60) + ((tradeable_float != 0) & (tradeable_float < 20))
+
+    # Short interest: squeeze potential 10-30%, moderate 5-10%, fraud risk >40%
+    score += 2 * (10 < short_pct < 30) + (5 < short_pct < 10) - 2 * (short_pct > 40)
+
+    # Flags: max +2 for green, -1 for each red
+    score += min(n_green, 2) - n_red
+
+    return max(0, min(10, score))
+
+
+def _truthy(column: np.ndarray) -> np.ndarray:
+    """Element-wise equivalent of `if value:` for a NaN-padded info column"""
+    return ~np.isnan(column) & (column != 0)
 
 
 class MarketStructureAnalyzer:
@@ -39,6 +215,8 @@ class MarketStructureAnalyzer:
     and what incentives they have.
     """
 
+    __slots__ = ('api_manager',)
+
     def __init__(self, api_manager=None):
         self.api_manager = api_manager
 
@@ -48,13 +226,20 @@ class MarketStructureAnalyzer:
 
         Returns comprehensive analysis with score 0-10
         """
-        print(f"\n{'='*80}")
-        print(f"MARKET STRUCTURE ANALYSIS: {ticker}")
-        print(f"{'='*80}\n")
+        logger.info("MARKET STRUCTURE ANALYSIS: %s", ticker)
 
         try:
-            stock = yf_helper.get_ticker(ticker)
-            info = stock.info
+            stock, info = _get_cached_stock_and_info(ticker)
+
+            # Delisted/invalid symbols and rate-limited fetches come back empty
+            if not info or not any(info.get(key) for key in ('sharesOutstanding', 'averageVolume', 'marketCap')):
+                logger.info("No market data for %s - skipping sub-analyses", ticker)
+                return {
+                    'ticker': ticker,
+                    'score': 0,
+                    'error': 'EMPTY_INFO',
+                    'red_flags': ['NO_DATA']
+                }
 
             analysis = {
                 'ticker': ticker,
@@ -69,36 +254,42 @@ class MarketStructureAnalyzer:
                 'warnings': []
             }
 
+            # stock.options is its own HTTP request - run it while the sub-analyses below work
+            options_future = _options_pool.submit(lambda: stock.options)
+
+            # Sub-analyses append flags straight into the layer-level lists
+            flags = {key: analysis[key] for key in ('red_flags', 'green_flags', 'warnings')}
+
             # 1. Float Analysis
-            print("Analyzing float structure...")
-            float_data = self.analyze_float(stock, info)
+            logger.info("Analyzing float structure...")
+            float_data = self.analyze_float(stock, info, flags)
             analysis['float_analysis'] = float_data
 
             # 2. Short Interest Analysis
-            print("Analyzing short interest...")
-            short_data = self.analyze_short_interest(stock, info)
+            logger.info("Analyzing short interest...")
+            short_data = self.analyze_short_interest(stock, info, flags)
             analysis['short_interest'] = short_data
 
             # 3. Liquidity Analysis
-            print("Analyzing liquidity...")
-            liquidity_data = self.analyze_liquidity(stock, info)
+            logger.info("Analyzing liquidity...")
+            liquidity_data = self.analyze_liquidity(stock, info, flags)
             analysis['liquidity'] = liquidity_data
 
             # 4. Options Activity (limited by free data)
-            print("Analyzing options activity...")
-            options_data = self.analyze_options_activity(stock, info)
+            logger.info("Analyzing options activity...")
+            options_data = self.analyze_options_activity(stock, info, flags, options_future)
             analysis['options_activity'] = options_data
 
             # Calculate score
             score = self._calculate_score(analysis)
             analysis['score'] = score
 
-            print(f"\nMarket Structure Score: {score}/10")
+            logger.info("Market Structure Score: %s/10", score)
 
             return analysis
 
         except Exception as e:
-            print(f"Error analyzing {ticker}: {e}")
+            logger.warning("Error analyzing %s: %s", ticker, e)
             return {
                 'ticker': ticker,
                 'score': 0,
@@ -106,7 +297,119 @@ class MarketStructureAnalyzer:
                 'red_flags': ['ANALYSIS_FAILED']
             }
 
-    def analyze_float(self, stock, info: Dict) -> Dict:
+    def analyze_many(self, tickers: List[str], max_workers: int = 8,
+                     timeout: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Analyze several tickers concurrently
+
+        The work is dominated by yfinance HTTP calls, so a thread pool
+        overlaps the network waits. Keep max_workers modest to stay under
+        Yahoo's rate limits.
+
+        timeout: seconds to wait for the whole batch (None = no limit). On
+        expiry the finished analyses are returned, queued tickers are
+        cancelled, and unfinished tickers get an error result with
+        error='TIMEOUT'. Analyses already running finish in the background.
+
+        Returns {ticker: analysis} in the order tickers were given
+        """
+        results = {}
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = {executor.submit(self.analyze, ticker): ticker for ticker in tickers}
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                results[futures[future]] = future.result()
+        except FuturesTimeoutError:
+            logger.warning("analyze_many timed out after %ss: %d of %d tickers finished",
+                           timeout, len(results), len(futures))
+        finally:
+            # Don't wait on unfinished work after a timeout (nothing is left otherwise)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return {
+            ticker: results.get(ticker) or {
+                'ticker': ticker,
+                'score': 0,
+                'error': 'TIMEOUT',
+                'red_flags': ['ANALYSIS_FAILED']
+            }
+            for ticker in tickers
+        }
+
+    def analyze_batch_scores(self, info_list: List[Dict],
+                             options_available: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Score many tickers at once from their info dicts
+
+        Column-wise version of analyze() + _calculate_score for screening a
+        universe: each rule is one vectorized comparison over all tickers
+        instead of a Python branch per ticker. Options availability needs its
+        own fetch per ticker, so it is passed in (default: none available).
+
+        Returns int array of scores 0-10 aligned with info_list
+        """
+        n = len(info_list)
+        records = _info_records(info_list)
+        shares_out = records['sharesOutstanding']
+        float_shares = records['floatShares']
+        insider = np.nan_to_num(records['heldPercentInsiders'])
+        institutional = np.nan_to_num(records['heldPercentInstitutions'])
+        short_float = records['shortPercentOfFloat']
+        short_ratio = records['shortRatio']
+        avg_volume = records['averageVolume']
+        market_cap = records['marketCap']
+        price = np.nan_to_num(records['currentPrice'])
+
+        if options_available is None:
+            options_available = np.zeros(n, dtype=bool)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Float structure (NaN where shares data is missing)
+            has_float = _truthy(shares_out) & _truthy(float_shares)
+            float_pct = float_shares / shares_out * 100
+            tradeable = np.where(
+                has_float,
+                np.maximum(0, float_pct - (insider * 100 + institutional * 100)),
+                np.nan
+            )
+
+            # Short interest
+            short_pct = short_float * 100
+
+            # Liquidity
+            has_volume = _truthy(avg_volume)
+            excellent = has_volume & (avg_volume > 10_000_000)
+            good = (avg_volume > 1_000_000) & ~excellent
+            moderate = (avg_volume > 100_000) & (avg_volume <= 1_000_000)
+            low = has_volume & (avg_volume <= 100_000)
+            turnover = np.where(has_volume & (market_cap > 0),
+                                avg_volume * price / market_cap, np.nan)
+
+        score = np.full(n, 5, dtype=np.int64)
+        score += 2 * ((tradeable > 20) & (tradeable < 60)) + ((tradeable > 0) & (tradeable < 20))
+        score += 2 * ((short_pct > 10) & (short_pct < 30)) + ((short_pct > 5) & (short_pct < 10))
+        score -= 2 * (short_pct > 40)
+        score += 3 * excellent + 2 * good + moderate - 2 * low
+        score += options_available
+
+        # Flag counts, one term per flag the scalar path can emit
+        n_green = (
+            (has_float & (tradeable < 20)).astype(np.int64)   # LOW_TRADEABLE_FLOAT
+            + ((short_pct >= 5) & (short_pct < 20))           # MODERATE_SHORT_INTEREST / SQUEEZE_POTENTIAL
+            + (short_ratio > 10)                              # HIGH_DAYS_TO_COVER
+            + excellent                                       # HIGH_LIQUIDITY
+            + (turnover > 0.01)                               # HIGH_TURNOVER
+            + options_available                               # OPTIONS_AVAILABLE
+        )
+        n_red = low.astype(np.int64)                          # LOW_LIQUIDITY
+
+        score += np.minimum(n_green, 2) - n_red
+
+        # analyze() scores tickers with no share, volume or cap data as 0
+        has_data = _truthy(shares_out) | _truthy(avg_volume) | _truthy(market_cap)
+        return np.where(has_data, np.clip(score, 0, 10), 0)
+
+    def analyze_float(self, stock, info: Dict, flags: Dict[str, List[str]]) -> Dict:
         """
         Analyze float structure
 
@@ -122,9 +425,7 @@ class MarketStructureAnalyzer:
             'shares_outstanding': None,
             'float_shares': None,
             'float_pct': None,
-            'tradeable_float_pct': None,
-            'red_flags': [],
-            'green_flags': []
+            'tradeable_float_pct': None
         }
 
         try:
@@ -137,7 +438,7 @@ class MarketStructureAnalyzer:
 
                 # Float as % of outstanding
                 float_pct = (float_shares / shares_outstanding) * 100
-                analysis['float_pct'] = round(float_pct, 2)
+                analysis['float_pct'] = float_pct
 
                 # Calculate tradeable float (after insider/institutional holdings)
                 insider_pct = info.get('heldPercentInsiders', 0) * 100
@@ -146,18 +447,18 @@ class MarketStructureAnalyzer:
                 # Tradeable float = total float - what's locked up
                 locked_up_pct = insider_pct + institutional_pct
                 tradeable_float_pct = max(0, float_pct - locked_up_pct)
-                analysis['tradeable_float_pct'] = round(tradeable_float_pct, 2)
+                analysis['tradeable_float_pct'] = tradeable_float_pct
 
                 # Flags based on float structure
                 if tradeable_float_pct < 20:
-                    analysis['green_flags'].append('LOW_TRADEABLE_FLOAT')
+                    flags['green_flags'].append('LOW_TRADEABLE_FLOAT')
                     analysis['note'] = 'Low float = high volatility potential'
                 elif tradeable_float_pct > 80:
-                    analysis['warnings'] = ['HIGH_FLOAT_LOW_CONTROL']
+                    flags['warnings'].append('HIGH_FLOAT_LOW_CONTROL')
 
                 # Very low float can be manipulated
                 if tradeable_float_pct < 10:
-                    analysis['warnings'] = analysis.get('warnings', []) + ['EXTREMELY_LOW_FLOAT']
+                    flags['warnings'].append('EXTREMELY_LOW_FLOAT')
 
                 # Share count
                 analysis['shares_outstanding_formatted'] = f"{shares_outstanding:,.0f}"
@@ -168,7 +469,7 @@ class MarketStructureAnalyzer:
         except Exception as e:
             return {'error': str(e)}
 
-    def analyze_short_interest(self, stock, info: Dict) -> Dict:
+    def analyze_short_interest(self, stock, info: Dict, flags: Dict[str, List[str]]) -> Dict:
         """
         Analyze short interest
 
@@ -189,10 +490,7 @@ class MarketStructureAnalyzer:
         analysis = {
             'short_percent_float': None,
             'short_percent_outstanding': None,
-            'short_ratio': None,
-            'red_flags': [],
-            'green_flags': [],
-            'warnings': []
+            'short_ratio': None
         }
 
         try:
@@ -202,29 +500,24 @@ class MarketStructureAnalyzer:
 
             if short_pct_float is not None:
                 short_pct = short_pct_float * 100
-                analysis['short_percent_float'] = round(short_pct, 2)
+                analysis['short_percent_float'] = short_pct
 
                 # Interpret short interest
-                if short_pct < 5:
-                    analysis['interpretation'] = 'Normal short interest'
-                elif short_pct < 10:
-                    analysis['interpretation'] = 'Elevated short interest'
-                    analysis['green_flags'].append('MODERATE_SHORT_INTEREST')
-                elif short_pct < 20:
-                    analysis['interpretation'] = 'High short interest - squeeze potential'
-                    analysis['green_flags'].append('SQUEEZE_POTENTIAL')
-                else:
-                    analysis['interpretation'] = 'Extreme short interest - investigate why'
-                    analysis['warnings'].append('EXTREME_SHORT_INTEREST')
+                bucket = bisect.bisect_right(_SHORT_BOUNDS, short_pct)
+                analysis['interpretation'] = _SHORT_INTERPRETATIONS[bucket]
+                if _SHORT_GREEN_FLAGS[bucket]:
+                    flags['green_flags'].append(_SHORT_GREEN_FLAGS[bucket])
+                if bucket == len(_SHORT_BOUNDS):
+                    flags['warnings'].append('EXTREME_SHORT_INTEREST')
                     analysis['note'] = 'Either fraud concerns or epic squeeze setup'
 
             if short_ratio is not None:
-                analysis['short_ratio'] = round(short_ratio, 2)
-                analysis['days_to_cover'] = round(short_ratio, 1)
+                analysis['short_ratio'] = short_ratio
+                analysis['days_to_cover'] = short_ratio
 
                 # Days to cover interpretation
                 if short_ratio > 10:
-                    analysis['green_flags'].append('HIGH_DAYS_TO_COVER')
+                    flags['green_flags'].append('HIGH_DAYS_TO_COVER')
                     analysis['squeeze_risk'] = 'Very high - shorts need many days to cover'
                 elif short_ratio > 5:
                     analysis['squeeze_risk'] = 'Moderate - could squeeze on volume spike'
@@ -236,7 +529,7 @@ class MarketStructureAnalyzer:
         except Exception as e:
             return {'error': str(e)}
 
-    def analyze_liquidity(self, stock, info: Dict) -> Dict:
+    def analyze_liquidity(self, stock, info: Dict, flags: Dict[str, List[str]]) -> Dict:
         """
         Analyze trading liquidity
 
@@ -254,9 +547,7 @@ class MarketStructureAnalyzer:
         analysis = {
             'avg_volume': None,
             'volume_to_mcap_ratio': None,
-            'liquidity_score': None,
-            'red_flags': [],
-            'green_flags': []
+            'liquidity_score': None
         }
 
         try:
@@ -268,34 +559,29 @@ class MarketStructureAnalyzer:
                 analysis['avg_volume_formatted'] = f"{avg_volume:,.0f}"
 
                 # Volume interpretation
-                if avg_volume > 10_000_000:
-                    analysis['liquidity_rating'] = 'EXCELLENT'
-                    analysis['green_flags'].append('HIGH_LIQUIDITY')
-                elif avg_volume > 1_000_000:
-                    analysis['liquidity_rating'] = 'GOOD'
-                elif avg_volume > 100_000:
-                    analysis['liquidity_rating'] = 'MODERATE'
-                    analysis['warnings'] = ['MODERATE_LIQUIDITY']
-                else:
-                    analysis['liquidity_rating'] = 'LOW'
-                    analysis['red_flags'].append('LOW_LIQUIDITY')
+                bucket = bisect.bisect_left(_LIQUIDITY_BOUNDS, avg_volume)
+                analysis['liquidity_rating'] = _LIQUIDITY_RATINGS[bucket]
+                if _LIQUIDITY_FLAGS[bucket]:
+                    flag_kind, flag = _LIQUIDITY_FLAGS[bucket]
+                    flags[flag_kind].append(flag)
 
                 # Volume to market cap ratio
                 if market_cap and market_cap > 0:
                     volume_mcap_ratio = (avg_volume * info.get('currentPrice', 0)) / market_cap
-                    analysis['volume_to_mcap_ratio'] = round(volume_mcap_ratio * 100, 4)
+                    analysis['volume_to_mcap_ratio'] = volume_mcap_ratio * 100
 
                     if volume_mcap_ratio > 0.01:  # >1% of market cap trades daily
-                        analysis['green_flags'].append('HIGH_TURNOVER')
+                        flags['green_flags'].append('HIGH_TURNOVER')
                     elif volume_mcap_ratio < 0.001:  # <0.1% trades daily
-                        analysis['warnings'] = analysis.get('warnings', []) + ['LOW_TURNOVER']
+                        flags['warnings'].append('LOW_TURNOVER')
 
             return analysis
 
         except Exception as e:
             return {'error': str(e)}
 
-    def analyze_options_activity(self, stock, info: Dict) -> Dict:
+    def analyze_options_activity(self, stock, info: Dict, flags: Dict[str, List[str]],
+                                 options_future: Optional[Future] = None) -> Dict:
         """
         Analyze options market activity
 
@@ -309,30 +595,31 @@ class MarketStructureAnalyzer:
         What we can get from yfinance:
         - Check if options are available
         - Implied volatility (if available)
+
+        options_future: pending stock.options fetch started by analyze();
+        read stock.options directly when not given
         """
         analysis = {
             'options_available': False,
-            'note': 'Full options flow analysis requires paid data',
-            'red_flags': [],
-            'green_flags': []
+            'note': 'Full options flow analysis requires paid data'
         }
 
         try:
             # Check if options are available
             try:
-                options_dates = stock.options
+                options_dates = options_future.result() if options_future else stock.options
                 if options_dates and len(options_dates) > 0:
                     analysis['options_available'] = True
                     analysis['expiration_dates_count'] = len(options_dates)
 
                     # Having options is generally good (more liquidity, hedging tools)
-                    analysis['green_flags'].append('OPTIONS_AVAILABLE')
+                    flags['green_flags'].append('OPTIONS_AVAILABLE')
 
                     # Could expand this to analyze specific options chains
                     # But would need careful rate limiting with yfinance
                 else:
                     analysis['options_available'] = False
-                    analysis['warnings'] = ['NO_OPTIONS_AVAILABLE']
+                    flags['warnings'].append('NO_OPTIONS_AVAILABLE')
             except:
                 analysis['options_available'] = False
                 analysis['note'] = 'Options data unavailable'
@@ -352,73 +639,26 @@ class MarketStructureAnalyzer:
         - Liquidity: 0-3 points
         - Options availability: 0-2 points
         """
-        score = 5  # Start neutral
-
-        # Float Analysis (0-3 points)
         float_data = analysis.get('float_analysis', {})
-        tradeable_float = float_data.get('tradeable_float_pct', 50)
-
-        if tradeable_float:
-            if 20 < tradeable_float < 60:  # Sweet spot - not too tight, not too loose
-                score += 2
-            elif tradeable_float < 20:  # Low float - volatile but interesting
-                score += 1
-            elif tradeable_float < 10:  # Too low - manipulation risk
-                score -= 1
-
-        # Short Interest (0-2 points)
         short_data = analysis.get('short_interest', {})
-        short_pct = short_data.get('short_percent_float', 0)
-
-        if short_pct:
-            if 10 < short_pct < 30:  # Squeeze potential without fraud concerns
-                score += 2
-            elif 5 < short_pct < 10:  # Moderate short interest
-                score += 1
-            elif short_pct > 40:  # Extreme - likely fraud concerns
-                score -= 2
-
-        # Liquidity (0-3 points)
         liquidity_data = analysis.get('liquidity', {})
-        liquidity_rating = liquidity_data.get('liquidity_rating', '')
-
-        if liquidity_rating == 'EXCELLENT':
-            score += 3
-        elif liquidity_rating == 'GOOD':
-            score += 2
-        elif liquidity_rating == 'MODERATE':
-            score += 1
-        elif liquidity_rating == 'LOW':
-            score -= 2
-
-        # Options availability (+1 if available)
         options_data = analysis.get('options_activity', {})
-        if options_data.get('options_available'):
-            score += 1
 
-        # Collect all flags
-        all_red_flags = []
-        all_green_flags = []
-        all_warnings = []
+        # Flag counts are taken before dedup
+        score = _score_kernel(
+            float(float_data.get('tradeable_float_pct', 50) or 0),
+            float(short_data.get('short_percent_float', 0) or 0),
+            _LIQUIDITY_POINTS.get(liquidity_data.get('liquidity_rating', ''), 0),
+            int(bool(options_data.get('options_available'))),
+            len(analysis['green_flags']),
+            len(analysis['red_flags'])
+        )
 
-        for category in ['float_analysis', 'short_interest', 'liquidity', 'options_activity']:
-            if category in analysis:
-                cat_data = analysis[category]
-                if isinstance(cat_data, dict):
-                    all_red_flags.extend(cat_data.get('red_flags', []))
-                    all_green_flags.extend(cat_data.get('green_flags', []))
-                    all_warnings.extend(cat_data.get('warnings', []))
+        # Order-preserving dedup of the flags the sub-analyses appended
+        for key in ('red_flags', 'green_flags', 'warnings'):
+            analysis[key] = list(dict.fromkeys(analysis[key]))
 
-        analysis['red_flags'] = list(set(all_red_flags))
-        analysis['green_flags'] = list(set(all_green_flags))
-        analysis['warnings'] = list(set(all_warnings))
-
-        # Bonus/penalty for flags
-        score += min(len(all_green_flags), 2)  # Max +2 for green flags
-        score -= len(all_red_flags)  # -1 for each red flag
-
-        # Cap at 0-10
-        return max(0, min(10, score))
+        return int(score)
 
 
 def main():
@@ -432,6 +672,8 @@ def main():
 
     ticker = sys.argv[1].upper()
 
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     analyzer = MarketStructureAnalyzer()
     result = analyzer.analyze(ticker)
 
@@ -10,13 +10,20 @@ Data Sources:
 This is a DIFFERENTIATOR - most tools don't parse SEC risk disclosures.
 """
 
-import requests
+import bisect
+import io
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from datetime import datetime
+import logging
+import math
 import re
 
+import numpy as np
+
 try:
     from src.sec_edgar_client import SECEdgarClient
     HAS_SEC_CLIENT = True
@@ -29,6 +36,168 @@ try:
 except:
     HAS_YFINANCE = False
 
+from market_truth.core.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    import json
+    HAS_ORJSON = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Financial and market risk read the same info dict; reuse a fetch for 5 minutes
+INFO_TTL = 300
+
+# ticker -> (fetched_at, info)
+_info_cache: Dict[str, tuple] = {}
+
+# Overall score buckets: [0, 4), [4, 6), [6, 8), [8, 10]
+_RISK_LEVEL_CUTS = (4, 6, 8)
+_RISK_LEVELS = ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW')
+
+# Financial risk ladders: bucket -> (score penalty, result list, message), None = no note
+# Debt/equity buckets (bisect_left): [0, 100], (100, 200], (200, inf)
+_DEBT_BOUNDS = (100, 200)
+_DEBT_RULES = (
+    (0, 'insights', "Healthy debt levels: D/E {:.1f}%"),
+    (1.5, 'insights', "Moderate debt: D/E ratio {:.1f}%"),
+    (3, 'red_flags', "High debt/equity ratio: {:.1f}%")
+)
+# Current ratio buckets (bisect_right): [0, 1.0), [1.0, 1.5), [1.5, inf)
+_CURRENT_RATIO_BOUNDS = (1.0, 1.5)
+_CURRENT_RATIO_RULES = (
+    (2, 'red_flags', "Low liquidity: Current ratio {:.2f}"),
+    (0.5, 'insights', "Moderate liquidity: Current ratio {:.2f}"),
+    (0, 'insights', "Strong liquidity: Current ratio {:.2f}")
+)
+# Profit margin buckets (bisect_right): (-inf, -20%), [-20%, 0), [0, inf)
+_MARGIN_BOUNDS = (-0.2, 0)
+_MARGIN_RULES = (
+    (2, 'red_flags', "Heavy losses: {:.1f}% margin"),
+    (1, 'insights', "Unprofitable: {:.1f}% margin"),
+    None
+)
+
+# info fields read by the batch financial risk scorer, one column each
+_FINANCIAL_FIELDS = ('debtToEquity', 'currentRatio', 'quickRatio', 'profitMargins')
+
+SEC_SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK{cik:010d}.json"
+
+# The submissions index only changes when the company files - 6 hours is fresh enough
+SUBMISSIONS_CACHE_TTL = 6 * 3600
+
+# Adverse 8-K items -> (score penalty at filing date, description)
+_ADVERSE_8K_ITEMS = {
+    '1.02': (1.0, 'Termination of material agreement'),
+    '4.01': (1.5, 'Change in auditor'),
+    '4.02': (2.0, 'Non-reliance on prior financial statements'),
+    '8.01': (0.25, 'Other events')
+}
+
+# Penalties fade with age: weight = exp(-days / LEGAL_DECAY_DAYS)
+LEGAL_DECAY_DAYS = 180
+SEC_ARCHIVES_URL = "https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{document}"
+
+# Item 1A runs until Item 1B (Unresolved Staff Comments), 1C (Cybersecurity) or 2 (Properties)
+_RISK_FACTORS_START = re.compile(r'item\s*1a\.?[\s:\-\u2013\u2014]*risk\s+factors', re.IGNORECASE)
+_RISK_FACTORS_END = re.compile(
+    r'item\s*(?:1b|1c|2)\.?[\s:\-\u2013\u2014]*(?:unresolved|cybersecurity|properties)', re.IGNORECASE
+)
+
+# Business risk: keyword hits per 10k words of Risk Factors text. Every 10-K carries some
+# boilerplate, so only density above the baseline costs points (1 point per step, capped)
+RISK_DENSITY_WORDS = 10_000
+_HIGH_RISK_BASELINE, _HIGH_RISK_STEP, _HIGH_RISK_MAX_PENALTY = 10.0, 4.0, 5
+_MEDIUM_RISK_BASELINE, _MEDIUM_RISK_STEP, _MEDIUM_RISK_MAX_PENALTY = 20.0, 10.0, 2
+# Rarely disclosed outside real trouble - only these raise a red flag
+_RED_FLAG_KEYWORDS = frozenset({'going concern', 'restatement', 'insolvency', 'liquidity crisis'})
+
+
+def _flush_leading(elem, parts: List[str]) -> None:
+    """
+    Emit the inline content that precedes a block in its parent, then drop it
+
+    Covers the parent's own text and earlier siblings with their tails (inline
+    runs like <font>Item 1A</font>, or blocks already emitted and cleared).
+    """
+    parent = elem.getparent()
+    if parent is None or (parent.text is None and elem.getprevious() is None):
+        return
+
+    siblings = list(elem.itersiblings(preceding=True))[::-1]
+    text = ''.join(chain(
+        [parent.text or ''],
+        chain.from_iterable((*sib.itertext(), sib.tail or '') for sib in siblings)
+    )).strip()
+    if text:
+        parts.append(text)
+
+    parent.text = None
+    for sib in siblings:
+        parent.remove(sib)
+
+
+def _html_to_text(html: bytes) -> str:
+    """
+    Extract the prose of a filing, dropping tables
+
+    Streams the HTML with lxml.iterparse and frees each block once its text
+    is read, so memory stays flat on 5-50MB 10-K documents. Text before a
+    nested block is emitted when that block starts, keeping document order.
+    """
+    from lxml import etree
+
+    parts = []
+    table_depth = 0
+    for event, elem in etree.iterparse(io.BytesIO(html), events=('start', 'end'),
+                                       tag=('p', 'div', 'table'), html=True, recover=True):
+        if event == 'start':
+            if table_depth == 0:
+                _flush_leading(elem, parts)
+            table_depth += elem.tag == 'table'
+            continue
+
+        if elem.tag == 'table':
+            table_depth -= 1
+        elif table_depth == 0:
+            # Earlier nested blocks were emitted and cleared, so this is the block's remaining text
+            text = ''.join(elem.itertext()).strip()
+            if text:
+                parts.append(text)
+
+        if table_depth == 0:
+            elem.clear(keep_tail=True)
+
+    return '\n'.join(parts)
+
+
+def _extract_risk_factors(text: str) -> Optional[str]:
+    """
+    Cut the Item 1A Risk Factors section out of 10-K text
+
+    The heading also appears in the table of contents and in cross-references,
+    so the longest span from a heading to the next item heading is taken as
+    the real section.
+    """
+    best = None
+    for start in _RISK_FACTORS_START.finditer(text):
+        end = _RISK_FACTORS_END.search(text, start.end())
+        if end is None:
+            # Later mentions (e.g. in MD&A) have no following item heading
+            break
+        section = text[start.end():end.start()]
+        if best is None or len(section) > len(best):
+            best = section
+    return best
+
 
 class RiskAssessmentAnalyzer:
     """
@@ -68,6 +237,24 @@ class RiskAssessmentAnalyzer:
             'loss of key personnel', 'patent expiration', 'product recall'
         ]
 
+        self._submissions_cache = DiskCache('sec_submissions', ttl=SUBMISSIONS_CACHE_TTL)
+
+        # keyword -> severity, for tallying scan hits
+        self._keyword_severity = {kw: 'MEDIUM' for kw in self.medium_risk_keywords}
+        self._keyword_severity.update({kw: 'HIGH' for kw in self.high_risk_keywords})
+
+        # One C-level Aho-Corasick automaton over all keywords: a single pass per 10-K
+        self._automaton = None
+        if HAS_AHOCORASICK:
+            self._automaton = ahocorasick.Automaton()
+            for kw, severity in self._keyword_severity.items():
+                self._automaton.add_word(kw, (severity, kw))
+            self._automaton.make_automaton()
+
+        # Without pyahocorasick: one compiled alternation, longest keywords first
+        alternation = '|'.join(map(re.escape, sorted(self._keyword_severity, key=len, reverse=True)))
+        self._keyword_re = re.compile(rf'\b({alternation})\b', re.IGNORECASE)
+
     def analyze(self, ticker: str) -> Dict[str, Any]:
         """
         Complete risk assessment for a company
@@ -85,9 +272,7 @@ class RiskAssessmentAnalyzer:
                 'data_quality': 'PRIMARY/SECONDARY/LOW'
             }
         """
-        print(f"\n{'='*80}")
-        print(f"RISK ASSESSMENT ANALYSIS: {ticker}")
-        print(f"{'='*80}\n")
+        logger.info("RISK ASSESSMENT ANALYSIS: %s", ticker)
 
         result = {
             'score': 5,  # Default neutral
@@ -101,32 +286,36 @@ class RiskAssessmentAnalyzer:
             'data_quality': 'SECONDARY'
         }
 
-        # 1. Business Risk (from 10-K Risk Factors)
-        print("Analyzing business risk from SEC 10-K...")
-        business_risk = self.analyze_business_risk(ticker)
-        result['business_risk'] = business_risk['score']
-        result['insights'].extend(business_risk.get('insights', []))
-        result['red_flags'].extend(business_risk.get('red_flags', []))
-
-        # 2. Financial Risk (leverage, cash burn)
-        print("Analyzing financial risk...")
-        financial_risk = self.analyze_financial_risk(ticker)
-        result['financial_risk'] = financial_risk['score']
-        result['insights'].extend(financial_risk.get('insights', []))
-        result['red_flags'].extend(financial_risk.get('red_flags', []))
-
-        # 3. Legal/Regulatory Risk (from 8-K filings)
-        print("Checking legal and regulatory events...")
-        legal_risk = self.analyze_legal_risk(ticker)
-        result['legal_risk'] = legal_risk['score']
-        result['insights'].extend(legal_risk.get('insights', []))
-        result['red_flags'].extend(legal_risk.get('red_flags', []))
-
-        # 4. Market Risk (volatility, beta)
-        print("Analyzing market risk...")
-        market_risk = self.analyze_market_risk(ticker)
-        result['market_risk'] = market_risk['score']
-        result['insights'].extend(market_risk.get('insights', []))
+        # Financial and market risk share one info fetch
+        info = None
+        if HAS_YFINANCE:
+            try:
+                info = self._fetch_yf_info(ticker)
+            except Exception as e:
+                logger.warning("Could not fetch info for %s: %s", ticker, e)
+
+        # The four sub-analyses are independent SEC/yfinance requests - run them together
+        logger.info("Analyzing business, financial, legal and market risk...")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {
+                pool.submit(self.analyze_business_risk, ticker): 'business_risk',         # 10-K Risk Factors
+                pool.submit(self.analyze_financial_risk, ticker, info): 'financial_risk', # leverage, cash burn
+                pool.submit(self.analyze_legal_risk, ticker): 'legal_risk',               # 8-K filings
+                pool.submit(self.analyze_market_risk, ticker, info): 'market_risk'        # volatility, beta
+            }
+            risks = {futures[future]: future.result() for future in as_completed(futures)}
+
+        # Merge in a fixed order so insights read the same on every run;
+        # dict.fromkeys drops phrases repeated across sub-analyses
+        for name, risk in risks.items():
+            result[name] = risk['score']
+        order = ('business_risk', 'financial_risk', 'legal_risk', 'market_risk')
+        result['insights'] = list(dict.fromkeys(chain.from_iterable(
+            risks[name].get('insights', []) for name in order
+        )))
+        result['red_flags'] = list(dict.fromkeys(chain.from_iterable(
+            risks[name].get('red_flags', []) for name in order[:3]  # market risk reports insights only
+        )))
 
         # Calculate overall risk score (weighted average)
         result['score'] = round(
@@ -138,30 +327,154 @@ class RiskAssessmentAnalyzer:
         )
 
         # Determine risk level
-        if result['score'] >= 8:
-            result['risk_level'] = 'LOW'
-        elif result['score'] >= 6:
-            result['risk_level'] = 'MEDIUM'
-        elif result['score'] >= 4:
-            result['risk_level'] = 'HIGH'
-        else:
-            result['risk_level'] = 'CRITICAL'
+        result['risk_level'] = _RISK_LEVELS[bisect.bisect_right(_RISK_LEVEL_CUTS, result['score'])]
 
         # Set data quality
-        if business_risk.get('has_sec_data') or legal_risk.get('has_sec_data'):
+        if risks['business_risk'].get('has_sec_data') or risks['legal_risk'].get('has_sec_data'):
             result['data_quality'] = 'PRIMARY'
 
-        print(f"\nRisk Assessment Score: {result['score']}/10")
-        print(f"Risk Level: {result['risk_level']}")
-        if result['red_flags']:
-            print(f"Red Flags: {len(result['red_flags'])}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Risk Assessment Score: %s/10", result['score'])
+            logger.info("Risk Level: %s", result['risk_level'])
+            if result['red_flags']:
+                logger.info("Red Flags: %d", len(result['red_flags']))
 
         return result
 
-    def analyze_business_risk(self, ticker: str) -> Dict[str, Any]:
+    def analyze_batch(self, tickers: List[str], max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        Risk assessment for many tickers
+
+        yfinance info for the whole batch is fetched up front on a thread
+        pool, then the per-ticker analyses (mostly SEC requests under the
+        API manager's rate limit) run concurrently and read info from the
+        shared cache.
+
+        Returns {ticker: result} in the order tickers were given
+        """
+        if HAS_YFINANCE:
+            self._fetch_yf_infos(tickers, max_workers)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(self.analyze, ticker): ticker for ticker in tickers}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return {ticker: results[ticker] for ticker in tickers}
+
+    def _fetch_yf_infos(self, tickers: List[str], max_workers: int = 8) -> Dict[str, Dict]:
+        """
+        Fetch yfinance info for several tickers concurrently
+
+        At most max_workers requests are in flight; tickers whose fetch
+        fails are left out.
+
+        Returns {ticker: info}
+        """
+        infos = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(self._fetch_yf_info, ticker): ticker for ticker in tickers}
+            for future in as_completed(futures):
+                try:
+                    infos[futures[future]] = future.result()
+                except Exception as e:
+                    logger.warning("Could not fetch info for %s: %s", futures[future], e)
+        return infos
+
+    def _fetch_yf_info(self, ticker: str) -> Dict:
+        """Get yfinance info for ticker, reusing a fetch younger than INFO_TTL"""
+        cached = _info_cache.get(ticker)
+        if cached and time.time() - cached[0] < INFO_TTL:
+            return cached[1]
+
+        info = yf_helper.get_ticker(ticker).info
+        _info_cache[ticker] = (time.time(), info)
+        return info
+
+    def _sec_get(self, url: str):
+        """GET an SEC URL through the API manager's session and rate limit"""
+        api_manager = self.api_manager
+        if api_manager is None:
+            # Standalone analyzers share the process-wide manager, so every SEC request
+            # counts against the same rate limit
+            from market_truth.core.api_manager import get_api_manager
+            api_manager = get_api_manager()
+        return api_manager.sec_get(url)
+
+    @staticmethod
+    def _loads(content: bytes) -> Any:
+        """Decode an SEC JSON body (multi-MB for large filers), with orjson when installed"""
+        return orjson.loads(content) if HAS_ORJSON else json.loads(content)
+
+    def _get_cik(self, ticker: str) -> Optional[int]:
+        """Look up a ticker's CIK"""
+        if self.api_manager:
+            return self.api_manager.get_cik(ticker)
+        return self.sec_client.get_cik_from_ticker(ticker)
+
+    def _get_submissions(self, cik: int) -> Dict:
+        """Get a company's SEC submissions index (recent filings with form types and items)"""
+        return self._submissions_cache.get_or_fetch(
+            str(int(cik)),
+            lambda: self._loads(self._sec_get(SEC_SUBMISSIONS_URL.format(cik=int(cik))).content)
+        )
+
+    def _fetch_10k_text(self, ticker: str) -> Optional[str]:
+        """
+        Get the Risk Factors section of the latest 10-K
+
+        Returns None if the company has no 10-K or the section can't be found
+        """
+        cik = self._get_cik(ticker)
+        if not cik:
+            return None
+
+        recent = self._get_submissions(cik).get('filings', {}).get('recent', {})
+        forms = recent.get('form', [])
+        if '10-K' not in forms:
+            return None
+
+        i = forms.index('10-K')  # recent filings are newest first
+        url = SEC_ARCHIVES_URL.format(
+            cik=int(cik),
+            accession=recent['accessionNumber'][i].replace('-', ''),
+            document=recent['primaryDocument'][i]
+        )
+        return _extract_risk_factors(_html_to_text(self._sec_get(url).content))
+
+    def _scan_risk_text(self, text: str) -> Dict[str, Counter]:
+        """
+        Count risk keyword occurrences in filing text
+
+        Returns {'HIGH': Counter(keyword -> hits), 'MEDIUM': Counter(...)}
+        """
+        hits = {'HIGH': Counter(), 'MEDIUM': Counter()}
+
+        if self._automaton is None:
+            for m in self._keyword_re.finditer(text):
+                kw = m.group(1).lower()
+                hits[self._keyword_severity[kw]][kw] += 1
+            return hits
+
+        text = text.lower()
+        last = len(text) - 1
+        for end, (severity, kw) in self._automaton.iter(text):
+            # The automaton matches substrings; keep whole-word hits only ('fine' but not 'define')
+            start = end - len(kw) + 1
+            if start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_'):
+                continue
+            if end < last and (text[end + 1].isalnum() or text[end + 1] == '_'):
+                continue
+            hits[severity][kw] += 1
+        return hits
+
+    def analyze_business_risk(self, ticker: str, risk_text: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze business risk from SEC 10-K Risk Factors section
 
+        risk_text: Risk Factors text to scan for risk keywords, when available
+
         Returns score 0-10 (10 = lowest risk)
         """
         result = {
@@ -171,28 +484,51 @@ class RiskAssessmentAnalyzer:
             'has_sec_data': False
         }
 
-        if not self.sec_client:
+        if not risk_text and self.sec_client:
+            try:
+                risk_text = self._fetch_10k_text(ticker)
+            except Exception as e:
+                logger.warning("Could not fetch 10-K for %s: %s", ticker, e)
+
+        if risk_text:
+            hits = self._scan_risk_text(risk_text)
+            high, medium = hits['HIGH'], hits['MEDIUM']
+
+            # Normalize by section length so long filings aren't penalized for being long
+            per_unit = RISK_DENSITY_WORDS / max(len(risk_text.split()), 1)
+            high_density = sum(high.values()) * per_unit
+            medium_density = sum(medium.values()) * per_unit
+
+            penalty = min(max(0.0, high_density - _HIGH_RISK_BASELINE) / _HIGH_RISK_STEP, _HIGH_RISK_MAX_PENALTY)
+            penalty += min(max(0.0, medium_density - _MEDIUM_RISK_BASELINE) / _MEDIUM_RISK_STEP, _MEDIUM_RISK_MAX_PENALTY)
+            result['score'] = round(10 - penalty, 1)
+
+            flagged = sorted(_RED_FLAG_KEYWORDS.intersection(high))
+            if flagged:
+                result['red_flags'].append(f"High-risk disclosures: {', '.join(flagged)}")
+            if high_density > _HIGH_RISK_BASELINE:
+                result['insights'].append(
+                    f"Elevated high-risk language: {high_density:.1f} mentions per 10k words "
+                    f"({', '.join(kw for kw, _ in high.most_common(3))})"
+                )
+            if medium:
+                result['insights'].append(f"Risk factors mention: {', '.join(sorted(medium))}")
+            result['has_sec_data'] = True
             return result
 
-        try:
-            # Try to get recent 10-K filing
-            # Note: This is simplified - you'd need to parse the full 10-K
-            # For now, we'll use a heuristic approach
-
-            # Placeholder: In production, you'd fetch and parse the actual 10-K
-            # For MVP, we score based on available data
+        if self.sec_client:
+            # No readable Risk Factors section - score on available data
             result['insights'].append("Business risk assessment based on available SEC data")
             result['has_sec_data'] = True
 
-        except Exception as e:
-            print(f"Could not fetch 10-K: {e}")
-
         return result
 
-    def analyze_financial_risk(self, ticker: str) -> Dict[str, Any]:
+    def analyze_financial_risk(self, ticker: str, info: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Analyze financial risk: leverage, cash burn, solvency
 
+        info: pre-fetched yfinance info (fetched here when not given)
+
         Returns score 0-10 (10 = lowest risk)
         """
         result = {
@@ -205,34 +541,22 @@ class RiskAssessmentAnalyzer:
             return result
 
         try:
-            ticker_obj = yf_helper.get_ticker(ticker)
-            info = ticker_obj.info
+            if info is None:
+                info = self._fetch_yf_info(ticker)
 
             score = 10
 
             # Check debt levels
             debt_to_equity = info.get('debtToEquity')
             if debt_to_equity:
-                if debt_to_equity > 200:
-                    score -= 3
-                    result['red_flags'].append(f"High debt/equity ratio: {debt_to_equity:.1f}%")
-                elif debt_to_equity > 100:
-                    score -= 1.5
-                    result['insights'].append(f"Moderate debt: D/E ratio {debt_to_equity:.1f}%")
-                else:
-                    result['insights'].append(f"Healthy debt levels: D/E {debt_to_equity:.1f}%")
+                rule = _DEBT_RULES[bisect.bisect_left(_DEBT_BOUNDS, debt_to_equity)]
+                score -= self._apply_rule(result, rule, debt_to_equity)
 
             # Check current ratio (liquidity)
             current_ratio = info.get('currentRatio')
             if current_ratio:
-                if current_ratio < 1.0:
-                    score -= 2
-                    result['red_flags'].append(f"Low liquidity: Current ratio {current_ratio:.2f}")
-                elif current_ratio < 1.5:
-                    score -= 0.5
-                    result['insights'].append(f"Moderate liquidity: Current ratio {current_ratio:.2f}")
-                else:
-                    result['insights'].append(f"Strong liquidity: Current ratio {current_ratio:.2f}")
+                rule = _CURRENT_RATIO_RULES[bisect.bisect_right(_CURRENT_RATIO_BOUNDS, current_ratio)]
+                score -= self._apply_rule(result, rule, current_ratio)
 
             # Check quick ratio (stricter liquidity test)
             quick_ratio = info.get('quickRatio')
@@ -243,20 +567,51 @@ class RiskAssessmentAnalyzer:
             # Check profitability (negative = cash burn)
             profit_margin = info.get('profitMargins')
             if profit_margin:
-                if profit_margin < -0.2:
-                    score -= 2
-                    result['red_flags'].append(f"Heavy losses: {profit_margin*100:.1f}% margin")
-                elif profit_margin < 0:
-                    score -= 1
-                    result['insights'].append(f"Unprofitable: {profit_margin*100:.1f}% margin")
+                rule = _MARGIN_RULES[bisect.bisect_right(_MARGIN_BOUNDS, profit_margin)]
+                score -= self._apply_rule(result, rule, profit_margin * 100)
 
             result['score'] = max(0, min(10, score))
 
         except Exception as e:
-            print(f"Financial risk analysis error: {e}")
+            logger.warning("Financial risk analysis error for %s: %s", ticker, e)
 
         return result
 
+    @staticmethod
+    def _apply_rule(result: Dict[str, Any], rule: Optional[tuple], value: float) -> float:
+        """Record a ladder rule's message in result and return its score penalty"""
+        if rule is None:
+            return 0
+        penalty, key, message = rule
+        result[key].append(message.format(value))
+        return penalty
+
+    def analyze_financial_risk_batch(self, info_list: List[Dict]) -> np.ndarray:
+        """
+        Score financial risk for many tickers at once from their info dicts
+
+        Column-wise version of analyze_financial_risk's score for screening a
+        universe: each threshold is one vectorized comparison over all tickers,
+        accumulated as fixed-point int8 half-points.
+
+        Returns float array of scores 0-10 aligned with info_list
+        """
+        # (N, 4) with NaN where a field is missing; NaN fails every comparison below
+        metrics = np.array([tuple(map(info.get, _FINANCIAL_FIELDS)) for info in info_list],
+                           dtype=np.float64).reshape(-1, len(_FINANCIAL_FIELDS))
+        debt_to_equity, current_ratio, quick_ratio, profit_margin = metrics.T
+
+        # Every penalty is a multiple of 0.5, so tally exact half-points in int8
+        # (max 16 per ticker); a ratio of exactly 0 is skipped like the scalar `if value:` guards
+        half_points = np.zeros((len(metrics), len(_FINANCIAL_FIELDS)), dtype=np.int8)
+        half_points[:, 0] = np.where(debt_to_equity > 200, 6, np.where(debt_to_equity > 100, 3, 0))
+        half_points[:, 1] = np.where(current_ratio == 0, 0,
+                                     np.where(current_ratio < 1.0, 4, np.where(current_ratio < 1.5, 1, 0)))
+        half_points[:, 2] = 2 * ((quick_ratio != 0) & (quick_ratio < 0.5))
+        half_points[:, 3] = np.where(profit_margin < -0.2, 4, np.where(profit_margin < 0, 2, 0))
+
+        return np.clip(20 - half_points.sum(axis=1, dtype=np.int8), 0, 20) * 0.5
+
     def analyze_legal_risk(self, ticker: str) -> Dict[str, Any]:
         """
         Analyze legal/regulatory risk from 8-K filings
@@ -270,22 +625,66 @@ class RiskAssessmentAnalyzer:
             'has_sec_data': False
         }
 
-        # For MVP, we'll do basic checks
-        # In production, you'd parse actual 8-K filings for:
-        # - Item 1.01: Entry into Material Agreement
-        # - Item 1.02: Termination of Material Agreement
-        # - Item 2.01: Completion of Acquisition
-        # - Item 4.01: Changes in Auditor
-        # - Item 8.01: Other Events (often bad news)
-
-        result['insights'].append("No recent material legal events detected")
+        # The submissions index lists every recent filing with its 8-K item codes,
+        # so one request covers all 8-Ks without downloading filing bodies
+        if self.api_manager or self.sec_client:
+            try:
+                cik = self._get_cik(ticker)
+                if cik:
+                    recent = self._get_submissions(cik).get('filings', {}).get('recent', {})
+                    self._score_8k_items(recent, result)
+                    result['has_sec_data'] = True
+            except Exception as e:
+                logger.warning("Could not fetch 8-K filings for %s: %s", ticker, e)
+
+        if not result['red_flags'] and result['score'] >= 9:
+            result['insights'].append("No recent material legal events detected")
 
         return result
 
-    def analyze_market_risk(self, ticker: str) -> Dict[str, Any]:
+    def _score_8k_items(self, recent: Dict, result: Dict[str, Any]) -> None:
+        """
+        Score adverse 8-K item codes from a submissions index into result
+
+        Items checked:
+        - Item 1.02: Termination of Material Agreement
+        - Item 4.01: Changes in Auditor
+        - Item 4.02: Non-Reliance on Previously Issued Financials
+        - Item 8.01: Other Events (often bad news)
+        """
+        today = datetime.now().date()
+        penalty = 0.0
+        events = Counter()
+
+        for form, filed, items in zip(recent.get('form', []), recent.get('filingDate', []),
+                                      recent.get('items', [])):
+            if not form.startswith('8-K') or not items:
+                continue
+
+            adverse = set(items.split(',')) & _ADVERSE_8K_ITEMS.keys()
+            if not adverse:
+                continue
+
+            days = (today - datetime.strptime(filed, '%Y-%m-%d').date()).days
+            decay = math.exp(-max(days, 0) / LEGAL_DECAY_DAYS)
+            for item in adverse:
+                weight, description = _ADVERSE_8K_ITEMS[item]
+                penalty += weight * decay
+                if days <= 365:
+                    events[item] += 1
+                    if item in ('4.01', '4.02'):
+                        result['red_flags'].append(f"{description} (8-K Item {item}) filed {filed}")
+
+        result['score'] = round(max(0, 10 - penalty), 1)
+        for item, count in sorted(events.items()):
+            result['insights'].append(f"{count}x 8-K Item {item} ({_ADVERSE_8K_ITEMS[item][1]}) in past year")
+
+    def analyze_market_risk(self, ticker: str, info: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Analyze market risk: volatility, beta, drawdowns
 
+        info: pre-fetched yfinance info (fetched here when not given)
+
         Returns score 0-10 (10 = lowest risk)
         """
         result = {
@@ -298,8 +697,8 @@ class RiskAssessmentAnalyzer:
             return result
 
         try:
-            ticker_obj = yf_helper.get_ticker(ticker)
-            info = ticker_obj.info
+            if info is None:
+                info = self._fetch_yf_info(ticker)
 
             score = 10
 
@@ -332,13 +731,14 @@ class RiskAssessmentAnalyzer:
             result['score'] = max(0, min(10, score))
 
         except Exception as e:
-            print(f"Market risk analysis error: {e}")
+            logger.warning("Market risk analysis error for %s: %s", ticker, e)
 
         return result
 
 
 if __name__ == "__main__":
     # Test the analyzer
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     analyzer = RiskAssessmentAnalyzer()
     result = analyzer.analyze('AAPL')
 
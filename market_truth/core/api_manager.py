@@ -5,10 +5,18 @@ Coordinates all API access with proper rate limiting, fallback, and tracking
 Philosophy: Single source of truth for all market data APIs
 """
 
+import copy
+import logging
 import os
+import threading
 import time
-from typing import Optional, Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterable
 from dotenv import load_dotenv
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
 
 # Add project root to path
@@ -19,16 +27,45 @@ from src.fmp_client import FMPClient
 from src.sec_edgar_client import SECEdgarClient
 from src.yfinance_helper import yf_helper
 
+from market_truth.core.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    import json
+    HAS_ORJSON = False
+
 try:
     from src.api_call_tracker import api_tracker
     HAS_TRACKER = True
 except:
     HAS_TRACKER = False
-    print("[Warning] API call tracker not available")
+    logger.info("API call tracker not available")
 
 # Load environment variables
 load_dotenv()
 
+# SEC's ticker -> CIK table for every registrant
+COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+
+# A ticker's CIK effectively never changes; filing metadata (10-K, proxy, Form 4)
+# changes at most daily
+CIK_CACHE_TTL = 30 * 86400
+FILING_CACHE_TTL = 86400
+
+# Full ticker -> CIK table; new listings show up within a day
+COMPANY_TICKERS_TTL = 86400
+
+# In-process reuse of get_sec_data results across analyzer layers
+SEC_DATA_TTL = 3600
+SEC_DATA_CACHE_SIZE = 4096
+
+# In-process reuse of get_stock_data results (profile / ticker object) across layers
+STOCK_DATA_TTL = 3600
+
 
 class APIManager:
     """
@@ -51,17 +88,41 @@ class APIManager:
         # Initialize clients
         self.fmp_client = None
         self.sec_client = None
+        self.sec_session = None
         self.yf_helper = yf_helper
 
         # Rate limiting
-        self.last_fmp_call = 0
-        self.last_sec_call = 0
-        self.last_yf_call = 0
-
-        self.fmp_delay = 0.2  # 5 requests/second
-        self.sec_delay = 0.15  # ~6 requests/second (under 10/s limit)
+        self.last_yf_call = float('-inf')
         self.yf_delay = 0.5   # Conservative for yfinance
 
+        # Analyzers call in from worker threads; the limiters must not race
+        self._yf_lock = threading.Lock()
+
+        # FMP allows 5 requests/second, SEC 10: track call times in a sliding 1s
+        # window so concurrent requests go out together instead of spaced apart
+        self.fmp_max_per_second = 5
+        self._fmp_calls = deque()
+        self._fmp_lock = threading.Lock()
+
+        self.sec_max_per_second = 10
+        self._sec_calls = deque()
+        self._sec_lock = threading.Lock()
+
+        # On-disk SEC caches shared across runs
+        self._cik_cache = DiskCache('sec_cik', ttl=CIK_CACHE_TTL)
+        self._filing_cache = DiskCache('sec_filings', ttl=FILING_CACHE_TTL)
+        self._company_tickers_cache = DiskCache('sec_company_tickers', ttl=COMPANY_TICKERS_TTL)
+
+        # ticker -> (fetched_at, get_sec_data result)
+        self._sec_data_cache: Dict[str, tuple] = {}
+
+        # (ticker, use_fmp) -> (fetched_at, get_stock_data result)
+        self._stock_data_cache: Dict[tuple, tuple] = {}
+
+        # ticker -> CIK for every registrant, loaded on first lookup
+        self._cik_map: Optional[Dict[str, int]] = None
+        self._cik_map_lock = threading.Lock()
+
         # Initialize clients
         self._init_clients()
 
@@ -71,46 +132,112 @@ class APIManager:
         # 1. FMP Client (PRIMARY)
         try:
             self.fmp_client = FMPClient()
-            print("[+] FMP API client initialized")
-            print("[!] WARNING: FMP legacy endpoints deprecated (Aug 2025)")
-            print("[!] Disabling FMP, using yfinance as primary")
+            logger.info("FMP API client initialized")
+            logger.warning("FMP legacy endpoints deprecated (Aug 2025) - disabling FMP, using yfinance as primary")
             self.fmp_client = None  # Temporarily disable due to API changes
         except Exception as e:
-            print(f"[!] FMP API not available: {e}")
+            logger.warning("FMP API not available: %s", e)
             self.fmp_client = None
 
         # 2. SEC EDGAR Client
         try:
             user_agent = f"Mozilla/5.0 ({self.sec_user_email})"
+            self.sec_session = self._make_sec_session(user_agent)
             self.sec_client = SECEdgarClient(user_agent=user_agent)
-            print(f"[+] SEC EDGAR client initialized (email: {self.sec_user_email})")
+
+            # Route the client through the pooled keep-alive session if it has one
+            if isinstance(getattr(self.sec_client, 'session', None), requests.Session):
+                self.sec_client.session = self.sec_session
+
+            logger.info("SEC EDGAR client initialized (email: %s)", self.sec_user_email)
         except Exception as e:
-            print(f"[!] SEC EDGAR client error: {e}")
+            logger.warning("SEC EDGAR client error: %s", e)
             self.sec_client = None
 
         # 3. yfinance (FALLBACK)
-        print("[+] yfinance helper available")
+        logger.info("yfinance helper available")
+
+    def _make_sec_session(self, user_agent: str) -> requests.Session:
+        """
+        Build the shared SEC HTTP session
+
+        One pooled keep-alive session reuses TCP/TLS connections across
+        requests instead of handshaking per call; transient 429/5xx
+        responses are retried with backoff.
+        """
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': user_agent,
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        retry = Retry(total=3, backoff_factor=0.1, status_forcelist=(429, 500, 502, 503, 504))
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+        return session
+
+    def prewarm(self) -> None:
+        """
+        Open a pooled connection to data.sec.gov in the background
+
+        Opt-in: call before a batch of SEC requests so the first one skips
+        the TLS handshake. Returns immediately; failures are ignored.
+        """
+        if self.sec_session is not None:
+            threading.Thread(target=self._prewarm, daemon=True).start()
+
+    def _prewarm(self):
+        """Open a pooled connection to data.sec.gov (best effort)"""
+        try:
+            self._rate_limit_sec()
+            self.sec_session.head("https://data.sec.gov/", timeout=5)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _wait_for_slot(calls: deque, lock: threading.Lock, max_per_second: int):
+        """Block until a call fits in the sliding 1s window, then record it (thread-safe)"""
+        while True:
+            with lock:
+                now = time.monotonic()
+                while calls and now - calls[0] >= 1.0:
+                    calls.popleft()
+                if len(calls) < max_per_second:
+                    calls.append(now)
+                    return
+                wait = 1.0 - (now - calls[0])
+            time.sleep(wait)
 
     def _rate_limit_fmp(self):
         """Rate limit FMP API calls"""
-        elapsed = time.time() - self.last_fmp_call
-        if elapsed < self.fmp_delay:
-            time.sleep(self.fmp_delay - elapsed)
-        self.last_fmp_call = time.time()
+        self._wait_for_slot(self._fmp_calls, self._fmp_lock, self.fmp_max_per_second)
+
+    def _fmp_call(self, method, *args, **kwargs):
+        """Call an FMP client method under the FMP rate limit"""
+        self._rate_limit_fmp()
+        return method(*args, **kwargs)
 
     def _rate_limit_sec(self):
         """Rate limit SEC API calls"""
-        elapsed = time.time() - self.last_sec_call
-        if elapsed < self.sec_delay:
-            time.sleep(self.sec_delay - elapsed)
-        self.last_sec_call = time.time()
+        self._wait_for_slot(self._sec_calls, self._sec_lock, self.sec_max_per_second)
+
+    def _sec_call(self, method, *args, **kwargs):
+        """Call an SEC client method under the SEC rate limit"""
+        self._rate_limit_sec()
+        return method(*args, **kwargs)
 
     def _rate_limit_yf(self):
-        """Rate limit yfinance calls"""
-        elapsed = time.time() - self.last_yf_call
-        if elapsed < self.yf_delay:
-            time.sleep(self.yf_delay - elapsed)
-        self.last_yf_call = time.time()
+        """
+        Rate limit yfinance calls
+
+        Each caller reserves the next free slot under the lock and sleeps
+        outside it, only for as long as its slot is in the future.
+        """
+        with self._yf_lock:
+            now = time.monotonic()
+            slot = max(now, self.last_yf_call + self.yf_delay)
+            self.last_yf_call = slot
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
 
     def get_stock_data(self, ticker: str, use_fmp: bool = True) -> Dict[str, Any]:
         """
@@ -120,6 +247,9 @@ class APIManager:
         1. FMP (if available and use_fmp=True)
         2. yfinance (always available)
 
+        Results are reused in-process for STOCK_DATA_TTL, so the layers of
+        one analysis share a single profile / ticker object.
+
         Returns:
             {
                 'data': stock_object,
@@ -127,6 +257,18 @@ class APIManager:
                 'quality': 'PRIMARY' | 'FALLBACK'
             }
         """
+        key = (ticker.upper(), use_fmp)
+        cached = self._stock_data_cache.get(key)
+        if cached and time.time() - cached[0] < STOCK_DATA_TTL:
+            return dict(cached[1])
+
+        data = self._fetch_stock_data(ticker, use_fmp)
+        if data['data'] is not None:
+            self._stock_data_cache[key] = (time.time(), data)
+        return dict(data)
+
+    def _fetch_stock_data(self, ticker: str, use_fmp: bool) -> Dict[str, Any]:
+        """Fetch stock data from FMP, falling back to yfinance"""
 
         # Try FMP first (if enabled and available)
         if use_fmp and self.fmp_client:
@@ -141,7 +283,7 @@ class APIManager:
                         'client': self.fmp_client
                     }
             except Exception as e:
-                print(f"[!] FMP failed for {ticker}: {e}")
+                logger.warning("FMP failed for %s: %s", ticker, e)
 
         # Fallback to yfinance
         try:
@@ -154,7 +296,7 @@ class APIManager:
                 'client': self.yf_helper
             }
         except Exception as e:
-            print(f"[!] yfinance failed for {ticker}: {e}")
+            logger.warning("yfinance failed for %s: %s", ticker, e)
             return {
                 'data': None,
                 'source': 'NONE',
@@ -182,14 +324,15 @@ class APIManager:
         # Try FMP first (best data quality)
         if self.fmp_client:
             try:
-                self._rate_limit_fmp()
-                income = self.fmp_client.get_income_statement(ticker, period='annual', limit=5)
-
-                self._rate_limit_fmp()
-                balance = self.fmp_client.get_balance_sheet(ticker, period='annual', limit=5)
-
-                self._rate_limit_fmp()
-                cash_flow = self.fmp_client.get_cash_flow_statement(ticker, period='annual', limit=5)
+                # The three statements are independent requests - issue them together
+                with ThreadPoolExecutor(max_workers=3) as pool:
+                    futures = [
+                        pool.submit(self._fmp_call, method, ticker, period='annual', limit=5)
+                        for method in (self.fmp_client.get_income_statement,
+                                       self.fmp_client.get_balance_sheet,
+                                       self.fmp_client.get_cash_flow_statement)
+                    ]
+                income, balance, cash_flow = (future.result() for future in futures)
 
                 if income or balance or cash_flow:
                     result['source'] = 'FMP'
@@ -200,7 +343,7 @@ class APIManager:
                     return result
 
             except Exception as e:
-                print(f"[!] FMP financials failed: {e}")
+                logger.warning("FMP financials failed for %s: %s", ticker, e)
 
         # Fallback to yfinance
         try:
@@ -219,12 +362,110 @@ class APIManager:
             result['error'] = str(e)
             return result
 
+    def sec_get(self, url: str) -> requests.Response:
+        """
+        GET an SEC URL through the shared session, under the SEC rate limit
+
+        Raises requests.HTTPError on an error status
+        """
+        if self.sec_session is None:
+            raise RuntimeError("SEC session not available")
+        self._rate_limit_sec()
+        response = self.sec_session.get(url, timeout=30)
+        response.raise_for_status()
+        return response
+
+    def _get_sec_json(self, url: str) -> Any:
+        """GET a JSON document from SEC through the shared session"""
+        response = self.sec_get(url)
+        # SEC JSON runs to megabytes (company_tickers, submissions); orjson decodes it ~3x faster
+        return orjson.loads(response.content) if HAS_ORJSON else json.loads(response.content)
+
+    def _fetch_company_tickers(self) -> Dict[str, int]:
+        """Download SEC's company_tickers.json as {ticker: cik}"""
+        data = self._get_sec_json(COMPANY_TICKERS_URL)
+        return {row['ticker'].upper(): int(row['cik_str']) for row in data.values()}
+
+    def _load_cik_map(self) -> Dict[str, int]:
+        """
+        Get the in-process ticker -> CIK map
+
+        Loaded once per process from the on-disk copy (COMPANY_TICKERS_TTL)
+        or SEC; if both fail the map stays empty and lookups fall back
+        to the per-ticker path.
+        """
+        if self._cik_map is None:
+            with self._cik_map_lock:
+                if self._cik_map is None:
+                    try:
+                        self._cik_map = self._company_tickers_cache.get_or_fetch(
+                            'company_tickers', self._fetch_company_tickers
+                        )
+                    except Exception as e:
+                        logger.warning("Could not load SEC company tickers: %s", e)
+                        self._cik_map = {}
+        return self._cik_map
+
+    def get_cik(self, ticker: str) -> Optional[int]:
+        """
+        Get the SEC CIK for a ticker
+
+        Looked up in the in-process company tickers map first, then the
+        per-ticker disk cache; misses go to the SEC client
+        """
+        ticker = ticker.upper()
+        cik = self._load_cik_map().get(ticker)
+        if cik is not None:
+            return cik
+
+        cik = self._cik_cache.get(ticker)
+        if cik is None and self.sec_client:
+            cik = self._sec_call(self.sec_client.get_cik_from_ticker, ticker)
+            if cik:
+                self._cik_cache.set(ticker, cik)
+        return cik
+
+    def bulk_prefetch_ciks(self, tickers: Optional[Iterable[str]] = None) -> int:
+        """
+        Fill the CIK cache from SEC's company_tickers.json in one request
+
+        tickers: symbols to cache (default: every listed registrant)
+
+        Returns number of CIKs cached
+        """
+        ciks = self._fetch_company_tickers()
+
+        wanted = ciks.keys() if tickers is None else {t.upper() for t in tickers} & ciks.keys()
+        for ticker in wanted:
+            self._cik_cache.set(ticker, ciks[ticker])
+        return len(wanted)
+
     def get_sec_data(self, ticker: str) -> Dict[str, Any]:
         """
         Get SEC filing data
 
+        Results are reused in-process for SEC_DATA_TTL, so several analyzer
+        layers asking for the same ticker cost one set of SEC requests.
+        Each caller gets its own deep copy, so nested filings can be mutated
+        without touching the cache.
+
         Returns latest 10-K, proxy, and insider transactions
         """
+        key = ticker.upper()
+        cached = self._sec_data_cache.get(key)
+        if cached and time.time() - cached[0] < SEC_DATA_TTL:
+            return copy.deepcopy(cached[1])
+
+        data = self._fetch_sec_data(ticker)
+        if data.get('has_data'):
+            # Bounded: evict the oldest ticker once the cache is full
+            if key not in self._sec_data_cache and len(self._sec_data_cache) >= SEC_DATA_CACHE_SIZE:
+                self._sec_data_cache.pop(next(iter(self._sec_data_cache)), None)
+            self._sec_data_cache[key] = (time.time(), copy.deepcopy(data))
+        return data
+
+    def _fetch_sec_data(self, ticker: str) -> Dict[str, Any]:
+        """Fetch latest 10-K, proxy, and insider transactions from SEC"""
 
         if not self.sec_client:
             return {
@@ -234,8 +475,7 @@ class APIManager:
 
         try:
             # Get CIK
-            self._rate_limit_sec()
-            cik = self.sec_client.get_cik_from_ticker(ticker)
+            cik = self.get_cik(ticker)
 
             if not cik:
                 return {
@@ -243,17 +483,27 @@ class APIManager:
                     'has_data': False
                 }
 
-            # Get latest 10-K
-            self._rate_limit_sec()
-            filing_10k = self.sec_client.get_latest_10k(ticker)
-
-            # Get latest proxy
-            self._rate_limit_sec()
-            proxy = self.sec_client.get_latest_proxy(ticker)
-
-            # Get insider transactions
-            self._rate_limit_sec()
-            insider_filings = self.sec_client.get_insider_transactions(ticker, days_back=180)
+            # Latest 10-K, latest proxy and insider transactions are independent
+            # requests - issue them together under the shared rate limit,
+            # each cached on disk for FILING_CACHE_TTL
+            key = ticker.upper()
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                future_10k = pool.submit(
+                    self._filing_cache.get_or_fetch, f"{key}_10K",
+                    lambda: self._sec_call(self.sec_client.get_latest_10k, ticker)
+                )
+                future_proxy = pool.submit(
+                    self._filing_cache.get_or_fetch, f"{key}_DEF14A",
+                    lambda: self._sec_call(self.sec_client.get_latest_proxy, ticker)
+                )
+                future_insider = pool.submit(
+                    self._filing_cache.get_or_fetch, f"{key}_FORM4_180d",
+                    lambda: self._sec_call(self.sec_client.get_insider_transactions, ticker, days_back=180)
+                )
+
+            filing_10k = future_10k.result()
+            proxy = future_proxy.result()
+            insider_filings = future_insider.result()
 
             return {
                 'has_data': True,
@@ -288,12 +538,15 @@ class APIManager:
 
 # Singleton instance
 _api_manager = None
+_api_manager_lock = threading.Lock()
 
 def get_api_manager() -> APIManager:
-    """Get singleton API manager instance"""
+    """Get singleton API manager instance (thread-safe)"""
     global _api_manager
     if _api_manager is None:
-        _api_manager = APIManager()
+        with _api_manager_lock:
+            if _api_manager is None:
+                _api_manager = APIManager()
     return _api_manager
 
 
@@ -308,6 +561,8 @@ if __name__ == "__main__":
 
     ticker = sys.argv[1].upper()
 
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     print(f"\n{'='*80}")
     print(f"API MANAGER TEST: {ticker}")
     print(f"{'='*80}\n")
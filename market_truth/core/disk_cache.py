@@ -0,0 +1,93 @@
+"""
+Disk Cache
+Persistent JSON cache with a time-to-live per entry
+
+Key Insight: SEC filings change at most quarterly, but every run re-fetches them.
+Caching the fetched payloads on disk turns re-runs into local file reads.
+
+Storage: cache/{namespace}/{key}.json
+"""
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+def _to_json(value: Any) -> Any:
+    """JSON fallback: numpy values to Python, dates to ISO strings, else str"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+class DiskCache:
+    """
+    Namespaced key/value cache backed by one JSON file per key
+
+    Each entry records when it was written; entries older than `ttl`
+    seconds are treated as missing and re-fetched.
+    """
+
+    def __init__(self, namespace: str, ttl: float = 86400, cache_dir: Optional[str] = None):
+        if cache_dir is None:
+            cache_dir = Path(__file__).parent.parent / "cache" / namespace
+        else:
+            cache_dir = Path(cache_dir) / namespace
+
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        """Map a cache key to a filesystem-safe file path"""
+        safe_key = re.sub(r'[^A-Za-z0-9_.-]', '_', key)
+        return self.cache_dir / f"{safe_key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for key
+
+        Returns None if the entry is missing, expired, or unreadable
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get('cached_at', 0) > self.ttl:
+            return None
+
+        return entry.get('value')
+
+    def set(self, key: str, value: Any) -> None:
+        """Write value to the cache under key"""
+        entry = {
+            'cached_at': time.time(),
+            'value': value
+        }
+        with open(self._path(key), 'w') as f:
+            json.dump(entry, f, default=_to_json)
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling fetch() on a miss
+
+        Empty results are not cached so transient fetch failures
+        are retried on the next call.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        value = fetch()
+        if value:
+            self.set(key, value)
+        return value
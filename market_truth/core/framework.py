@@ -17,18 +17,16 @@ Philosophy: Revenue is opinion, cash is fact. Find structural truth before the m
 
 Version 2.0: Now with cross-layer intelligence, industry weighting, and temporal tracking
 """
+import asyncio
 import os
 import sys
-
-# Add project root to path
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-sys.path.insert(0, project_root)
+import time
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from typing import Callable, Dict, List, Optional, Tuple
 
 # Import layer analyzers
 from market_truth.analyzers.financial_truth import FinancialTruthAnalyzer
@@ -44,6 +42,58 @@ from market_truth.core.layer_schema import LayerOutput
 from market_truth.core.synthesis_engine import SynthesisEngine
 from market_truth.core.temporal_engine import TemporalEngine
 from market_truth.core.api_manager import get_api_manager
+from market_truth.core.disk_cache import DiskCache
+from market_truth.core.jit import njit
+
+# A ticker's analysis is reused for the rest of the day it was run
+ANALYSIS_CACHE_TTL = 86400
+
+# Set MTF_DEBUG to keep each analyzer's raw output inside its normalized layer
+KEEP_RAW_LAYER_DATA = bool(os.environ.get('MTF_DEBUG'))
+
+# Analyzer layers (2-8) in scoring order
+LAYER_ORDER = (
+    'business_model',
+    'financial_truth',
+    'management',
+    'market_structure',
+    'competitive',
+    'macro',
+    'risk'
+)
+
+# Report labels for every layer in analysis['layers'], including the technical placeholder
+LAYER_DISPLAY: Dict[str, str] = {
+    name: name.replace('_', ' ').title() for name in ('technical',) + LAYER_ORDER
+}
+
+_TRAJECTORY_ICONS = {'improving': '^', 'deteriorating': 'v', 'stable': '->'}
+
+
+def _layer_scores(layers: Dict[str, Dict]) -> np.ndarray:
+    """Layer scores as a float64 vector in LAYER_ORDER (missing layers score 0)"""
+    return np.array([layers.get(name, {}).get('score', 0) for name in LAYER_ORDER], dtype=np.float64)
+
+
+@njit(cache=True)
+def _synthesize_core(scores, weights):
+    """
+    Raw score total and industry-weighted 0-100 score over layer arrays
+
+    Zero-weight (missing) layers drop out of the weighted score, as in
+    SynthesisEngine._calculate_weighted_score.
+    """
+    raw = 0.0
+    weighted_total = 0.0
+    weight_sum = 0.0
+    for i in range(scores.shape[0]):
+        raw += scores[i]
+        weighted_total += scores[i] * weights[i]
+        weight_sum += weights[i]
+
+    if weight_sum > 0:
+        return raw, (weighted_total / (10 * weight_sum)) * 100
+    return raw, 50.0
 
 
 class MarketTruthFramework:
@@ -82,23 +132,65 @@ class MarketTruthFramework:
         self.macro_analyzer = MacroForcesAnalyzer(api_manager=self.api_manager)
         self.risk_analyzer = RiskAssessmentAnalyzer(api_manager=self.api_manager)
 
+        # Layers 2-8 in LAYER_ORDER: (key, progress message, failure label, analyzer, score on failure)
+        self._layer_table: List[Tuple[str, str, str, Callable[[str], Dict], float]] = [
+            ('business_model', "Analyzing business model...", "Business model analysis",
+             self.business_model_analyzer.analyze, 0),
+            ('financial_truth', "Extracting financial truth...", "Financial analysis",
+             self.analyze_financial_truth, 0),
+            ('management', "Detecting management truth...", "Management analysis",
+             self.management_detector.analyze, 0),
+            ('market_structure', "Analyzing market structure...", "Market structure analysis",
+             self.market_structure_analyzer.analyze, 0),
+            ('competitive', "Mapping competitive landscape...", "Competitive analysis",
+             self.competitive_analyzer.analyze, 0),
+            ('macro', "Checking macro forces...", "Macro analysis",
+             self.macro_analyzer.analyze, 0),
+            ('risk', "Assessing overall risk...", "Risk assessment",
+             self.risk_analyzer.analyze, 5),
+        ]
+
         # Initialize intelligence core
         self.synthesis_engine = SynthesisEngine()
         self.temporal_engine = TemporalEngine()
 
-    def analyze(self, ticker: str) -> Dict:
+        # Completed analyses keyed by ticker and day
+        self._analysis_cache = DiskCache('analysis', ttl=ANALYSIS_CACHE_TTL)
+
+        # ticker -> (sector, industry) for synthesis weighting
+        self._profile_cache: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
+    def analyze(self, ticker: str, use_cache: bool = True, fast_screen: bool = False) -> Dict:
         """
         Run complete Market Truth Framework analysis on a ticker
 
+        Layers 2-8 are independent and I/O-bound, so they run concurrently
+        on a thread pool. Per-API pacing is left to the api_manager rate
+        limiters rather than fixed sleeps between layers.
+
+        A ticker already analyzed today is served from the on-disk analysis
+        cache (JSON-decoded) unless use_cache is False.
+
+        With fast_screen=True the layers run one at a time in table order and
+        the rest are skipped once a layer reports a structural disqualifier
+        (critical red flag), which saves their API calls when screening.
+
         Returns comprehensive analysis with scores for all 7 layers
         """
+        cache_key = f"{ticker.upper()}_{date.today().isoformat()}"
+        if use_cache:
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                print(f"[Cache] Using today's analysis for {ticker}")
+                return cached
+
         print(f"\n{'='*80}")
         print(f"MARKET TRUTH FRAMEWORK ANALYSIS: {ticker}")
         print(f"{'='*80}\n")
 
         analysis = {
             'ticker': ticker,
-            'timestamp': datetime.now(),
+            'timestamp_ns': time.time_ns(),
             'layers': {}
         }
 
@@ -109,93 +201,53 @@ class MarketTruthFramework:
             'note': 'Run professional_screener.py first to get technical score'
         }
 
-        # Layer 2: Business Model Forensics
-        print("Analyzing business model...")
-        try:
-            time.sleep(0.5)  # Small delay between layers
-            analysis['layers']['business_model'] = self.business_model_analyzer.analyze(ticker)
-        except Exception as e:
-            print(f"Business model analysis failed: {e}")
-            analysis['layers']['business_model'] = {'score': 0, 'error': str(e)}
-
-        # Layer 3: Financial Truth
-        print("Extracting financial truth...")
-        try:
-            time.sleep(0.5)
-            analysis['layers']['financial_truth'] = self.analyze_financial_truth(ticker)
-        except Exception as e:
-            print(f"Financial analysis failed: {e}")
-            analysis['layers']['financial_truth'] = {'score': 0, 'error': str(e)}
-
-        # Layer 4: Management Quality
-        print("Detecting management truth...")
-        try:
-            time.sleep(0.5)
-            analysis['layers']['management'] = self.management_detector.analyze(ticker)
-        except Exception as e:
-            print(f"Management analysis failed: {e}")
-            analysis['layers']['management'] = {'score': 0, 'error': str(e)}
-
-        # Layer 5: Market Structure
-        print("Analyzing market structure...")
-        try:
-            time.sleep(0.5)
-            analysis['layers']['market_structure'] = self.market_structure_analyzer.analyze(ticker)
-        except Exception as e:
-            print(f"Market structure analysis failed: {e}")
-            analysis['layers']['market_structure'] = {'score': 0, 'error': str(e)}
-
-        # Layer 6: Competitive Position
-        print("Mapping competitive landscape...")
-        try:
-            time.sleep(0.5)
-            analysis['layers']['competitive'] = self.competitive_analyzer.analyze(ticker)
-        except Exception as e:
-            print(f"Competitive analysis failed: {e}")
-            analysis['layers']['competitive'] = {'score': 0, 'error': str(e)}
-
-        # Layer 7: Macro Alignment
-        print("Checking macro forces...")
-        try:
-            time.sleep(0.5)
-            analysis['layers']['macro'] = self.macro_analyzer.analyze(ticker)
-        except Exception as e:
-            print(f"Macro analysis failed: {e}")
-            analysis['layers']['macro'] = {'score': 0, 'error': str(e)}
-
-        # Layer 8: Risk Assessment
-        print("Assessing overall risk...")
-        try:
-            time.sleep(0.5)
-            analysis['layers']['risk'] = self.risk_analyzer.analyze(ticker)
-        except Exception as e:
-            print(f"Risk assessment failed: {e}")
-            analysis['layers']['risk'] = {'score': 5, 'error': str(e)}
+        # Layers 2-8
+        if fast_screen:
+            results = []
+            for name, message, _, analyzer, _ in self._layer_table:
+                try:
+                    result = self._run_layer(message, analyzer, ticker)
+                except Exception as e:
+                    result = e
+                results.append(result)
+
+                critical = LayerOutput.critical_flags(result.get('red_flags', [])) if isinstance(result, dict) else []
+                if critical:
+                    analysis['early_exit_reason'] = f"{name}: {', '.join(critical)}"
+                    print(f"Early exit after {name}: {', '.join(critical)}")
+                    break
+        else:
+            with ThreadPoolExecutor(max_workers=len(self._layer_table)) as pool:
+                futures = [
+                    pool.submit(self._run_layer, message, analyzer, ticker)
+                    for _, message, _, analyzer, _ in self._layer_table
+                ]
+
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
+
+        for (name, _, label, _, default), result in zip(self._layer_table, results):
+            if isinstance(result, Exception):
+                print(f"{label} failed: {result}")
+                result = {'score': default, 'error': str(result)}
+            analysis['layers'][name] = result
+
+        # Layers skipped by an early exit normalize to empty "skipped_early_exit" layers
+        for name, _, _, _, default in self._layer_table[len(results):]:
+            analysis['layers'][name] = {'score': default, 'error': 'skipped_early_exit'}
 
         # Get company info for industry weighting
-        try:
-            stock_data = self.api_manager.get_stock_data(ticker)
-            if stock_data['source'] == 'FMP' and stock_data['data']:
-                # FMP profile data
-                profile = stock_data['data']
-                sector = profile.get('sector')
-                industry = profile.get('industry')
-            else:
-                # yfinance data
-                stock = stock_data['data']
-                info = stock.info
-                sector = info.get('sector')
-                industry = info.get('industry')
-        except Exception as e:
-            print(f"[Warning] Could not get sector/industry: {e}")
-            sector = None
-            industry = None
+        sector, industry = self._get_sector_industry(ticker, analysis['layers']['business_model'])
 
         # Normalize all layers to standard format
         normalized_layers = {}
         for layer_name, layer_data in analysis['layers'].items():
             if isinstance(layer_data, dict) and 'error' not in layer_data:
-                normalized_layers[layer_name] = LayerOutput.normalize(layer_data)
+                normalized_layers[layer_name] = LayerOutput.normalize(layer_data, keep_raw=KEEP_RAW_LAYER_DATA)
             elif isinstance(layer_data, dict) and 'error' in layer_data:
                 normalized_layers[layer_name] = LayerOutput.create_empty(layer_data.get('error', 'Unknown error'))
             else:
@@ -203,6 +255,7 @@ class MarketTruthFramework:
 
         # Update analysis with normalized layers
         analysis['layers_normalized'] = normalized_layers
+        analysis['scores_vec'] = _layer_scores(analysis['layers'])
 
         # Layer 9: Synthesis (Intelligence Core)
         print("\nRunning synthesis engine...")
@@ -211,7 +264,7 @@ class MarketTruthFramework:
             ticker=ticker,
             sector=sector,
             industry=industry
-        )
+        ).to_dict()
         analysis['synthesis'] = synthesis
 
         # Temporal tracking
@@ -224,8 +277,91 @@ class MarketTruthFramework:
             print(f"[Warning] Temporal tracking failed: {e}")
             analysis['temporal'] = None
 
+        # A partial analysis (early exit or a failed layer) must not stand in
+        # for a full one, or one transient API failure pins it for the day
+        if all(isinstance(layer, dict) and 'error' not in layer for layer in analysis['layers'].values()):
+            self._analysis_cache.set(cache_key, analysis)
+
         return analysis
 
+    @staticmethod
+    def _run_layer(message: str, analyzer: Callable[[str], Dict], ticker: str) -> Dict:
+        """Run one layer analyzer, announcing it as it starts"""
+        print(message)
+        return analyzer(ticker)
+
+    def analyze_many(
+        self,
+        tickers: List[str],
+        max_workers: int = 16,
+        fast_screen: bool = False
+    ) -> Dict[str, Dict]:
+        """
+        Run the full analysis for many tickers concurrently
+
+        Tickers are analyzed on a thread pool so one ticker's network waits
+        overlap with the others'; the api_manager rate limiters are
+        thread-safe and keep the combined request rate within each API's
+        quota. A ticker whose analysis raises gets {'ticker', 'error'}.
+
+        Returns {ticker: analysis} in the order tickers were given
+        """
+        tickers = list(dict.fromkeys(tickers))
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(self.analyze, ticker, fast_screen=fast_screen): ticker for ticker in tickers}
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    results[ticker] = future.result()
+                except Exception as e:
+                    print(f"Analysis failed for {ticker}: {e}")
+                    results[ticker] = {'ticker': ticker, 'error': str(e)}
+
+        return {ticker: results[ticker] for ticker in tickers}
+
+    async def analyze_async(self, ticker: str, use_cache: bool = True, fast_screen: bool = False) -> Dict:
+        """
+        Run analyze() from async code
+
+        The analysis runs in a worker thread, so an event loop that awaits
+        it (notebook, web handler, async batch driver) is never blocked.
+        """
+        return await asyncio.to_thread(self.analyze, ticker, use_cache, fast_screen)
+
+    def _get_sector_industry(
+        self,
+        ticker: str,
+        business_model: Optional[Dict] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Get company sector and industry for industry weighting
+
+        Uses the memoized profile, then the business model layer's output,
+        and only falls back to a fresh API lookup when neither has it.
+        """
+        if ticker in self._profile_cache:
+            return self._profile_cache[ticker]
+
+        if business_model and business_model.get('sector'):
+            profile = (business_model.get('sector'), business_model.get('industry'))
+        else:
+            try:
+                stock_data = self.api_manager.get_stock_data(ticker)
+                if stock_data['source'] == 'FMP' and stock_data['data']:
+                    # FMP profile data
+                    data = stock_data['data']
+                else:
+                    # yfinance data
+                    data = stock_data['data'].info
+                profile = (data.get('sector'), data.get('industry'))
+            except Exception as e:
+                print(f"[Warning] Could not get sector/industry: {e}")
+                return None, None
+
+        self._profile_cache[ticker] = profile
+        return profile
+
 
     def analyze_financial_truth(self, ticker: str) -> Dict:
         """
@@ -244,6 +380,23 @@ class MarketTruthFramework:
         return self.financial_analyzer.analyze(ticker)
 
 
+    @staticmethod
+    def score_matrix(analyses: Dict[str, Dict]) -> np.ndarray:
+        """
+        Stack per-ticker layer scores into an (N_tickers, 7) matrix
+
+        Rows follow the order of analyses (e.g. analyze_many output), columns
+        follow LAYER_ORDER, so screens are plain array filters:
+            fin = LAYER_ORDER.index('financial_truth')
+            strong = np.array(list(analyses))[matrix[:, fin] > 7]
+        """
+        if not analyses:
+            return np.empty((0, len(LAYER_ORDER)), dtype=np.float64)
+        return np.vstack([
+            np.asarray(a['scores_vec'], dtype=np.float64) if 'scores_vec' in a else _layer_scores(a.get('layers', {}))
+            for a in analyses.values()
+        ])
+
     def synthesize_analysis(self, analysis: Dict) -> Dict:
         """
         DEPRECATED: Legacy synthesis method (kept for backward compatibility)
@@ -263,95 +416,103 @@ class MarketTruthFramework:
                 'note': 'Using new synthesis engine - see analysis["synthesis"] for full details'
             }
 
-        # Fallback if synthesis not run yet
+        # Fallback if synthesis not run yet: default-weighted score over present layers
         layers = analysis['layers']
-        total_score = sum([
-            layers.get('business_model', {}).get('score', 0),
-            layers.get('financial_truth', {}).get('score', 0),
-            layers.get('management', {}).get('score', 0),
-            layers.get('market_structure', {}).get('score', 0),
-            layers.get('competitive', {}).get('score', 0),
-            layers.get('macro', {}).get('score', 0),
-            layers.get('risk', {}).get('score', 0)
-        ])
+        default_weights = self.synthesis_engine.default_weights
+        scores = analysis.get('scores_vec')
+        scores = _layer_scores(layers) if scores is None else np.asarray(scores, dtype=np.float64)
+        weights = np.array([default_weights.get(name, 1.0) if name in layers else 0.0
+                            for name in LAYER_ORDER], dtype=np.float64)
+        total_score, weighted_score = _synthesize_core(scores, weights)
 
         return {
             'total_score': total_score,
+            'weighted_score': round(weighted_score, 2),
             'max_score': 70,
             'action': 'RUN_NEW_SYNTHESIS',
             'note': 'Legacy method - run analyze() for full intelligence'
         }
 
 
-def main():
-    """Test the framework"""
-    import sys
-
-    if len(sys.argv) < 2:
-        print("Usage: python market_truth_framework.py <TICKER>")
-        print("\nExample: python market_truth_framework.py AAPL")
-        return
-
-    ticker = sys.argv[1].upper()
-
-    mtf = MarketTruthFramework()
-    analysis = mtf.analyze(ticker)
+def format_report(ticker: str, analysis: Dict) -> str:
+    """
+    Render an analysis as the text report printed by main()
 
-    # Display results
-    print(f"\n{'='*80}")
-    print(f"MARKET TRUTH ANALYSIS RESULTS: {ticker}")
-    print(f"{'='*80}\n")
+    Lines are collected and joined so a report (or a batch of them) goes
+    out in a single write.
+    """
+    lines = []
+    lines.append(f"\n{'='*80}")
+    lines.append(f"MARKET TRUTH ANALYSIS RESULTS: {ticker}")
+    lines.append(f"{'='*80}\n")
 
     # Layer scores
-    print("LAYER SCORES (Raw):")
+    lines.append("LAYER SCORES (Raw):")
     for layer_name, layer_data in analysis['layers'].items():
         if isinstance(layer_data, dict):
             score = layer_data.get('score', 'N/A')
             trajectory = analysis.get('layers_normalized', {}).get(layer_name, {}).get('trajectory', '')
-            trajectory_icon = {'improving': '^', 'deteriorating': 'v', 'stable': '->'}.get(trajectory, '')
-            print(f"  {layer_name.replace('_', ' ').title():30s} {score}/10 {trajectory_icon} {trajectory}")
+            trajectory_icon = _TRAJECTORY_ICONS.get(trajectory, '')
+            lines.append(f"  {LAYER_DISPLAY[layer_name]:30s} {score}/10 {trajectory_icon} {trajectory}")
 
     # Synthesis results
     synthesis = analysis['synthesis']
-    print(f"\n{'='*80}")
-    print(f"SYNTHESIS (Intelligence Core)")
-    print(f"{'='*80}")
-    print(f"Raw Score:      {synthesis.get('raw_score', 0):.1f}/70")
-    print(f"Weighted Score: {synthesis.get('weighted_score', 0):.1f}/100")
-    print(f"\nConviction:     {synthesis.get('conviction', 'UNKNOWN')}")
-    print(f"Action:         {synthesis.get('action', 'UNKNOWN')}")
-    print(f"Reasoning:      {synthesis.get('reasoning', 'N/A')}")
+    lines.append(f"\n{'='*80}")
+    lines.append(f"SYNTHESIS (Intelligence Core)")
+    lines.append(f"{'='*80}")
+    lines.append(f"Raw Score:      {synthesis.get('raw_score', 0):.1f}/70")
+    lines.append(f"Weighted Score: {synthesis.get('weighted_score', 0):.1f}/100")
+    lines.append(f"\nConviction:     {synthesis.get('conviction', 'UNKNOWN')}")
+    lines.append(f"Action:         {synthesis.get('action', 'UNKNOWN')}")
+    lines.append(f"Reasoning:      {synthesis.get('reasoning', 'N/A')}")
 
     # Belief state
     if 'belief_state' in synthesis:
         belief = synthesis['belief_state']
-        print(f"\nBELIEF STATE (Bayesian Probabilities):")
-        print(f"  P(Structural Bull): {belief.get('bull_prob', 0):.1%}")
-        print(f"  P(Structural Bear): {belief.get('bear_prob', 0):.1%}")
-        print(f"  P(Distress Risk):   {belief.get('distress_prob', 0):.1%}")
+        lines.append(f"\nBELIEF STATE (Bayesian Probabilities):")
+        lines.append(f"  P(Structural Bull): {belief.get('bull_prob', 0):.1%}")
+        lines.append(f"  P(Structural Bear): {belief.get('bear_prob', 0):.1%}")
+        lines.append(f"  P(Distress Risk):   {belief.get('distress_prob', 0):.1%}")
 
     # Overrides
     if synthesis.get('disqualified'):
-        print(f"\n⚠️  STRUCTURAL DISQUALIFIERS:")
+        lines.append(f"\n⚠️  STRUCTURAL DISQUALIFIERS:")
         for override in synthesis.get('override_rules', []):
-            print(f"  - {override}")
+            lines.append(f"  - {override}")
 
     # Temporal changes (if available)
     if analysis.get('temporal') and 'summary' in analysis['temporal']:
         temporal = analysis['temporal']
-        print(f"\n{'='*80}")
-        print(f"TEMPORAL ANALYSIS (Changes Since Last Run)")
-        print(f"{'='*80}")
-        print(f"{temporal['summary'].get('headline', 'No headline')}")
+        lines.append(f"\n{'='*80}")
+        lines.append(f"TEMPORAL ANALYSIS (Changes Since Last Run)")
+        lines.append(f"{'='*80}")
+        lines.append(f"{temporal['summary'].get('headline', 'No headline')}")
 
         if temporal['summary'].get('key_changes'):
-            print(f"\nKey Changes:")
+            lines.append(f"\nKey Changes:")
             for change in temporal['summary']['key_changes']:
-                print(f"  - {change}")
+                lines.append(f"  - {change}")
+
+        lines.append(f"\nRecommendation: {temporal['summary'].get('recommendation', 'N/A')}")
+
+    lines.append(f"\n{'='*80}\n")
 
-        print(f"\nRecommendation: {temporal['summary'].get('recommendation', 'N/A')}")
+    return "\n".join(lines)
+
+
+def main():
+    """Test the framework"""
+    if len(sys.argv) < 2:
+        print("Usage: python -m market_truth.core.framework <TICKER>")
+        print("\nExample: python -m market_truth.core.framework AAPL")
+        return
+
+    ticker = sys.argv[1].upper()
+
+    mtf = MarketTruthFramework()
+    analysis = mtf.analyze(ticker)
 
-    print(f"\n{'='*80}\n")
+    sys.stdout.write(format_report(ticker, analysis) + "\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,20 @@
+"""
+JIT Helpers
+Optional numba compilation for small numeric scoring kernels
+
+Key Insight: Layer scores are fixed decision trees evaluated once per ticker.
+Compiled with numba they cost nanoseconds; without numba the same kernels
+run as ordinary Python, so numba stays an optional dependency.
+"""
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Run numeric kernels as plain Python when numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
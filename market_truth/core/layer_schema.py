@@ -4,11 +4,48 @@ All analyzers must return this exact structure for cross-layer reasoning
 """
 from typing import Dict, List, Literal
 from datetime import datetime
+import numpy as np
 
 # Type definitions
 Trajectory = Literal["improving", "deteriorating", "stable", "unknown"]
 RiskLevel = Literal["critical", "high", "medium", "low", "minimal"]
 
+# Red flags that set a layer's risk level
+_CRITICAL_FLAGS = frozenset({
+    'NEGATIVE_FREE_CASH_FLOW',
+    'LOW_INTEREST_COVERAGE',
+    'REVENUE_UP_CASH_DOWN',
+    'DECLINING_REVENUE',
+    'BANKRUPTCY_RISK'
+})
+
+_HIGH_RISK_FLAGS = frozenset({
+    'HIGH_DEBT_TO_EBITDA',
+    'SLOW_COLLECTIONS',
+    'INVENTORY_BUILDING',
+    'INSIDER_HEAVY_SELLING'
+})
+
+# Small-int codes for the packed (screener) layer form
+RISK_CODES = {"minimal": 0, "low": 1, "medium": 2, "high": 3, "critical": 4}
+TRAJECTORY_CODES = {"unknown": 0, "stable": 1, "improving": 2, "deteriorating": 3}
+
+# One normalized layer in 3 bytes: normalized_score as 0-100, risk and trajectory codes
+PACKED_LAYER_DTYPE = np.dtype([('score', 'u1'), ('risk', 'u1'), ('trajectory', 'u1')])
+
+# Neutral layer for failed/skipped analyzers; flags are immutable so copies can share them
+_EMPTY_TEMPLATE = {
+    "score": 5,
+    "normalized_score": 0.5,
+    "trajectory": "unknown",
+    "risk_level": "medium",
+    "risk_flags": (),
+    "strength_flags": ()
+}
+
+# Keys that become top-level fields rather than layer-specific core signals
+_RESERVED_KEYS = frozenset({'score', 'red_flags', 'green_flags', 'timestamp', 'ticker', 'error'})
+
 
 class LayerOutput:
     """
@@ -22,12 +59,13 @@ class LayerOutput:
     """
 
     @staticmethod
-    def normalize(raw_output: Dict) -> Dict:
+    def normalize(raw_output: Dict, keep_raw: bool = False) -> Dict:
         """
         Convert legacy analyzer output to standardized format
 
         Args:
             raw_output: Old-style {'score': X, 'red_flags': [...], ...}
+            keep_raw: Embed raw_output as "raw_data" (for debugging)
 
         Returns:
             Standardized LayerOutput dict
@@ -39,9 +77,13 @@ class LayerOutput:
         red_flags = raw_output.get('red_flags', [])
         green_flags = raw_output.get('green_flags', [])
 
-        if len(green_flags) > len(red_flags) * 1.5:
+        red_n = len(red_flags)
+        green_n = len(green_flags)
+
+        # green > 1.5 * red (and vice versa) in integer arithmetic
+        if 2 * green_n > 3 * red_n:
             trajectory = "improving"
-        elif len(red_flags) > len(green_flags) * 1.5:
+        elif 2 * red_n > 3 * green_n:
             trajectory = "deteriorating"
         elif score > 0:
             trajectory = "stable"
@@ -49,59 +91,67 @@ class LayerOutput:
             trajectory = "unknown"
 
         # Risk flags to risk level
-        critical_flags = [
-            'NEGATIVE_FREE_CASH_FLOW',
-            'LOW_INTEREST_COVERAGE',
-            'REVENUE_UP_CASH_DOWN',
-            'DECLINING_REVENUE',
-            'BANKRUPTCY_RISK'
-        ]
-
-        high_risk_flags = [
-            'HIGH_DEBT_TO_EBITDA',
-            'SLOW_COLLECTIONS',
-            'INVENTORY_BUILDING',
-            'INSIDER_HEAVY_SELLING'
-        ]
-
-        risk_level = "minimal"
-        for flag in red_flags:
-            if flag in critical_flags:
-                risk_level = "critical"
-                break
-            elif flag in high_risk_flags:
-                risk_level = "high"
-
-        if risk_level == "minimal" and len(red_flags) > 3:
+        if not _CRITICAL_FLAGS.isdisjoint(red_flags):
+            risk_level = "critical"
+        elif not _HIGH_RISK_FLAGS.isdisjoint(red_flags):
+            risk_level = "high"
+        elif red_n > 3:
             risk_level = "medium"
-        elif risk_level == "minimal" and len(red_flags) > 0:
+        elif red_flags:
             risk_level = "low"
+        else:
+            risk_level = "minimal"
 
         # Extract core signals (layer-specific data)
-        core_signals = {k: v for k, v in raw_output.items()
-                       if k not in ['score', 'red_flags', 'green_flags', 'timestamp', 'ticker', 'error']}
+        core_signals = {k: v for k, v in raw_output.items() if k not in _RESERVED_KEYS}
 
-        return {
+        normalized = {
             "score": score,
             "normalized_score": round(score / 10, 2),  # 0-1 scale for Bayesian
             "trajectory": trajectory,
             "risk_level": risk_level,
             "risk_flags": red_flags,
             "strength_flags": green_flags,
-            "core_signals": core_signals,
-            "raw_data": raw_output  # Keep original for debugging
+            "core_signals": core_signals
         }
+        if keep_raw:
+            normalized["raw_data"] = raw_output  # Keep original for debugging
+        return normalized
+
+    @staticmethod
+    def critical_flags(red_flags: List[str]) -> List[str]:
+        """Red flags that make a layer critical (structural disqualifiers)"""
+        return [flag for flag in red_flags if flag in _CRITICAL_FLAGS]
 
     @staticmethod
     def create_empty(reason: str = "No data") -> Dict:
         """Create neutral/empty layer output"""
-        return {
-            "score": 5,
-            "normalized_score": 0.5,
-            "trajectory": "unknown",
-            "risk_level": "medium",
-            "risk_flags": [],
-            "strength_flags": [],
-            "core_signals": {"note": reason},
-            "raw_data": {}
-        }
+        empty = _EMPTY_TEMPLATE.copy()
+        empty["core_signals"] = {"note": reason}
+        return empty
+
+    @staticmethod
+    def _packed_fields(normalized: Dict) -> tuple:
+        """(score 0-100, risk code, trajectory code) for one normalized layer"""
+        score = min(max(round(normalized["normalized_score"] * 100), 0), 100)
+        return (score, RISK_CODES[normalized["risk_level"]], TRAJECTORY_CODES[normalized["trajectory"]])
+
+    @staticmethod
+    def to_packed(normalized: Dict) -> np.void:
+        """
+        Pack a normalized layer into a PACKED_LAYER_DTYPE record
+
+        Keeps only what cross-sectional screens filter on; use the dict
+        form for single-ticker introspection.
+        """
+        return np.array(LayerOutput._packed_fields(normalized), dtype=PACKED_LAYER_DTYPE)[()]
+
+    @staticmethod
+    def batch_pack(normalized_list: List[Dict]) -> np.ndarray:
+        """
+        Pack many normalized layers into one PACKED_LAYER_DTYPE array
+
+        Enables vectorized filters such as
+        arr[arr['risk'] == RISK_CODES['critical']]
+        """
+        return np.array([LayerOutput._packed_fields(n) for n in normalized_list], dtype=PACKED_LAYER_DTYPE)
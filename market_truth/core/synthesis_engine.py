@@ -10,15 +10,309 @@ Key Capabilities:
 3. Bayesian Belief Updates (layers inform each other, not just sum)
 4. Structural Override Rules (some combinations disqualify immediately)
 """
+import bisect
 import json
+import logging
+import math
 import os
 import sys
+from collections import Counter
+from dataclasses import dataclass, fields
+from functools import cache, reduce
+from operator import or_
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from typing import Dict, List, Optional, Tuple
-import numpy as np
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
 
-from market_truth.core.layer_schema import LayerOutput
+from market_truth.core.jit import HAS_NUMBA, njit, prange
+from market_truth.core.layer_schema import RISK_CODES
+
+logger = logging.getLogger(__name__)
+
+# Industry weights live in the project root config/
+WEIGHTS_PATH = Path(__file__).parent.parent.parent / "config" / "industry_weights.json"
+
+# Weight-set key used when neither industry nor sector has its own weights
+DEFAULT_WEIGHTS_KEY = '_default_weights'
+
+# Analyzer layers that carry industry weights, in scoring order
+_LAYER_KEYS = (
+    'business_model',
+    'financial_truth',
+    'management',
+    'market_structure',
+    'competitive',
+    'macro',
+    'risk'
+)
+_LAYER_KEY_SET = frozenset(_LAYER_KEYS)
+
+
+@cache
+def _load_weights() -> Tuple[Mapping[str, float], Mapping[str, Mapping[str, float]], Mapping[str, float]]:
+    """
+    Parse industry_weights.json once per process
+
+    Returns (default weights, industry/sector -> weights, weight-set key ->
+    weight sum). Every mapping, down to each weight set, is read-only: all
+    engines share them and the generated scorers bake their values in.
+    """
+    with open(WEIGHTS_PATH, 'r') as f:
+        raw_weights = json.load(f)
+
+    default_weights = MappingProxyType(raw_weights.get(DEFAULT_WEIGHTS_KEY, {}))
+
+    # Industry/sector -> layer weights; `_`-prefixed entries and keys are metadata
+    industry_weights = {
+        name: MappingProxyType({k: v for k, v in cfg.items() if not k.startswith('_')})
+        for name, cfg in raw_weights.items()
+        if not name.startswith('_')
+    }
+
+    # Weight-set key -> sum of its layer weights (missing layers weigh 1.0)
+    weight_sums = {
+        name: sum(weights.get(key, 1.0) for key in _LAYER_KEYS)
+        for name, weights in (*industry_weights.items(), (DEFAULT_WEIGHTS_KEY, default_weights))
+    }
+
+    return default_weights, MappingProxyType(industry_weights), MappingProxyType(weight_sums)
+
+
+def _compile_scorer(weights: Mapping[str, float], weight_sum: float) -> Optional[Callable]:
+    """
+    Generate a weighted scorer with one weight set baked in as literals
+
+    The generated function takes a score getter (LayerView.scores.get) for a
+    ticker with all seven layers and returns (normalized score, breakdown),
+    summing in _LAYER_KEYS order exactly like _calculate_weighted_score.
+    Weight sets with non-numeric or non-finite values are not specialized.
+    """
+    values = [weights.get(key, 1.0) for key in _LAYER_KEYS]
+    if not all(type(w) in (int, float) and math.isfinite(w) for w in values):
+        return None
+
+    lines = ['def scorer(score):']
+    for i, (key, weight) in enumerate(zip(_LAYER_KEYS, values)):
+        lines.append(f'    r{i} = score({key!r}, 5)')
+        lines.append(f'    w{i} = r{i} * {weight!r}')
+
+    max_possible = 10 * weight_sum
+    total = ' + '.join(['0'] + [f'w{i}' for i in range(len(values))])
+    lines.append(f'    normalized = (({total}) / {max_possible!r}) * 100' if max_possible > 0
+                 else '    normalized = 50')
+
+    breakdown = ', '.join(
+        f"{key!r}: {{'raw': r{i}, 'weight': {weight!r}, 'weighted': w{i}}}"
+        for i, (key, weight) in enumerate(zip(_LAYER_KEYS, values))
+    )
+    lines.append(f'    return normalized, {{{breakdown}}}')
+
+    namespace = {}
+    exec(compile('\n'.join(lines), '<synthesis scorer>', 'exec'), namespace)
+    return namespace['scorer']
+
+
+@cache
+def _load_scorers() -> Mapping[str, Callable]:
+    """Weight-set key -> specialized weighted scorer, built once per process"""
+    default_weights, industry_weights, weight_sums = _load_weights()
+    scorers = {}
+    for name, weights in (*industry_weights.items(), (DEFAULT_WEIGHTS_KEY, default_weights)):
+        scorer = _compile_scorer(weights, weight_sums[name])
+        if scorer is not None:
+            scorers[name] = scorer
+    return MappingProxyType(scorers)
+
+
+# Risk flags read by the structural rules, one bit each; other flags map to 0
+_FLAG_BITS = {
+    'NEGATIVE_FREE_CASH_FLOW': 1 << 0,
+    'INSIDER_HEAVY_SELLING': 1 << 1,
+    'DECLINING_REVENUE': 1 << 2,
+    'REVENUE_UP_CASH_DOWN': 1 << 3,
+    'HIGH_DEBT_TO_EBITDA': 1 << 4,
+    'LOW_INTEREST_COVERAGE': 1 << 5,
+    'LOW_MARGINS': 1 << 6
+}
+_NEG_FCF = _FLAG_BITS['NEGATIVE_FREE_CASH_FLOW']
+_INSIDER_SELL = _FLAG_BITS['INSIDER_HEAVY_SELLING']
+_DECLINING_REV = _FLAG_BITS['DECLINING_REVENUE']
+_REV_UP_CASH_DOWN = _FLAG_BITS['REVENUE_UP_CASH_DOWN']
+_HIGH_DEBT = _FLAG_BITS['HIGH_DEBT_TO_EBITDA']
+_LOW_COVERAGE = _FLAG_BITS['LOW_INTEREST_COVERAGE']
+_LOW_MARGINS = _FLAG_BITS['LOW_MARGINS']
+
+
+def _mask(flags: Iterable[str]) -> int:
+    """Bitmask of the rule-relevant flags in a layer's risk_flags"""
+    return reduce(or_, (_FLAG_BITS.get(flag, 0) for flag in flags), 0)
+
+
+# Risk levels as ordered RISK_CODES ints; missing or unknown levels code below all of them
+_NO_RISK_CODE = -1
+_HIGH_RISK = RISK_CODES['high']
+_CRITICAL_RISK = RISK_CODES['critical']
+
+
+# Belief priors and update multipliers as logs, so updates are additions
+_LOG_BULL_PRIOR = math.log(0.3)  # 30% of stocks are long-term winners
+_LOG_BEAR_PRIOR = math.log(0.2)  # 20% are structural shorts
+_LOG_DISTRESS_PRIOR = math.log(0.05)  # 5% face bankruptcy
+_LOG_DISQUALIFIED_BULL = math.log(0.05)
+_LOG_DISQUALIFIED_BEAR = math.log(0.7)
+_LOG_DISTRESS_CAP = math.log(0.5)
+_LOG2 = math.log(2)
+_LOG3 = math.log(3)
+_LOG5 = math.log(5)
+_LOG1_5 = math.log(1.5)
+_LOG0_3 = math.log(0.3)
+
+# Weighted-score cut-offs and the (conviction, action, reasoning) each band
+# maps to; the top band also needs bull_prob > 0.6, otherwise it drops a band
+_ACTION_THRESHOLDS = (40, 55, 65, 70)
+_ACTION_BANDS = (
+    ('AVOID', 'DO_NOT_TRADE', "Poor fundamentals (Score={score:.0f})"),
+    ('AVOID', 'SPECULATION_ONLY', "Weak case (Score={score:.0f}), too many red flags"),
+    ('LOW', 'TRADE_ONLY', "Marginal case (Score={score:.0f}), short-term only"),
+    ('MEDIUM', 'BUY_MEDIUM', "Solid setup (Score={score:.0f}, Bull P={bull:.0%})"),
+    ('HIGH', 'BUY_HIGH_CONVICTION', "High conviction structural winner (P={bull:.0%}, Score={score:.0f})")
+)
+_HIGH_BAND = len(_ACTION_THRESHOLDS)
+
+# exp() of a log sum can land an ulp off the product it stands for; rounding
+# keeps exact threshold hits such as 0.3 * 2 == 0.6 on the same side
+_BELIEF_DIGITS = 12
+
+
+@njit(cache=True)
+def _belief_core(fin_risk, biz_score, improving, deteriorating, disqualify):
+    """Bull, bear and distress probabilities from the layer evidence codes"""
+    # Start with priors (base rates)
+    log_bull = _LOG_BULL_PRIOR
+    log_bear = _LOG_BEAR_PRIOR
+    log_distress = _LOG_DISTRESS_PRIOR
+
+    # Financial layer updates distress probability
+    if fin_risk == _CRITICAL_RISK:
+        log_distress += _LOG5  # 25% distress risk
+    elif fin_risk == _HIGH_RISK:
+        log_distress += _LOG3  # 15% distress risk
+
+    # Business model updates bull probability
+    if biz_score >= 8:
+        log_bull += _LOG2  # 60% if strong business
+    elif biz_score <= 3:
+        log_bull += _LOG0_3  # 9% if weak business
+        log_bear += _LOG2  # 40% bear case
+
+    # Trajectory matters
+    if improving >= 3:
+        log_bull += _LOG1_5
+    if deteriorating >= 3:
+        log_bear += _LOG2
+        log_distress += _LOG1_5
+
+    # Structural overrides force probabilities
+    if disqualify:
+        log_bull = _LOG_DISQUALIFIED_BULL
+        log_bear = _LOG_DISQUALIFIED_BEAR
+        log_distress = min(log_distress + _LOG2, _LOG_DISTRESS_CAP)
+
+    bull_prob = round(math.exp(log_bull), _BELIEF_DIGITS)
+    bear_prob = round(math.exp(log_bear), _BELIEF_DIGITS)
+    distress_prob = round(math.exp(log_distress), _BELIEF_DIGITS)
+
+    # Normalize probabilities (only scales down when they sum past 1)
+    denom = max(bull_prob + bear_prob + distress_prob, 1.0)
+    bull_prob /= denom
+    bear_prob /= denom
+    distress_prob /= denom
+
+    return bull_prob, bear_prob, distress_prob
+
+
+@njit(cache=True, parallel=True)
+def _synth_kernel(scores, present, weights, fin_risk, biz_scores, improving, deteriorating,
+                  disqualify, out):
+    """
+    Weighted score and beliefs for a batch of tickers sharing one weight set
+
+    Fills out[i] with (weighted 0-100, bull, bear, distress). Layers are
+    summed in column order so results match the per-ticker path exactly.
+    """
+    for i in prange(scores.shape[0]):
+        weighted_total = 0.0
+        weight_sum = 0.0
+        for j in range(scores.shape[1]):
+            if present[i, j]:
+                weighted_total += scores[i, j] * weights[j]
+                weight_sum += weights[j]
+
+        max_possible = 10 * weight_sum
+        out[i, 0] = (weighted_total / max_possible) * 100 if max_possible > 0 else 50.0
+        out[i, 1], out[i, 2], out[i, 3] = _belief_core(
+            fin_risk[i], biz_scores[i], improving[i], deteriorating[i], disqualify[i]
+        )
+
+
+@dataclass(slots=True)
+class LayerView:
+    """Per-ticker layer facts, read in one pass and shared by every synthesis step"""
+    traj_counts: Counter
+    scores: Dict[str, float]                  # only layers that report a score
+    flag_masks: Dict[str, int]                # every layer, so also the presence map
+    risk_codes: Dict[str, int]
+    trajectories: Dict[str, Optional[str]]
+    raw_total: float                          # every layer's score, 5 when it reports none
+
+    @classmethod
+    def from_layers(cls, layers: Dict[str, Dict]) -> 'LayerView':
+        """Build the view from normalized layer outputs"""
+        scores = {}
+        flag_masks = {}
+        risk_codes = {}
+        trajectories = {}
+        raw_total = 0
+        for name, layer in layers.items():
+            if 'score' in layer:
+                scores[name] = layer['score']
+                raw_total += layer['score']
+            else:
+                raw_total += 5
+            flag_masks[name] = _mask(layer.get('risk_flags', ()))
+            risk_codes[name] = RISK_CODES.get(layer.get('risk_level'), _NO_RISK_CODE)
+            trajectories[name] = layer.get('trajectory')
+        return cls(Counter(trajectories.values()), scores, flag_masks, risk_codes, trajectories, raw_total)
+
+    def score(self, name: str, default: float) -> float:
+        """Layer score, or default when the layer is missing or reports none"""
+        return self.scores.get(name, default)
+
+    def risk_code(self, name: str) -> int:
+        """Layer risk level as a RISK_CODES int"""
+        return self.risk_codes.get(name, _NO_RISK_CODE)
+
+
+@dataclass(slots=True, frozen=True)
+class SynthesisResult:
+    """One ticker's synthesis; to_dict() gives the stored/JSON form"""
+    ticker: str
+    weighted_score: float
+    raw_score: float
+    conviction: str
+    action: str
+    reasoning: str
+    weights_used: Dict[str, float]
+    score_breakdown: Dict[str, Dict]
+    structural_analysis: Dict
+    belief_state: Dict[str, float]
+    disqualified: bool
+    override_rules: List[str]
+
+    def to_dict(self) -> Dict:
+        """Plain dict of the fields, in declaration order (nested values are shared)"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 
 class SynthesisEngine:
@@ -33,21 +327,18 @@ class SynthesisEngine:
     """
 
     def __init__(self):
-        # Load industry weights (from project root config/)
-        project_root = Path(__file__).parent.parent.parent
-        config_path = project_root / "config" / "industry_weights.json"
-        with open(config_path, 'r') as f:
-            self.industry_weights = json.load(f)
-
-        self.default_weights = self.industry_weights.get('_default_weights', {})
+        # Shared, parsed once per process
+        self.default_weights, self.industry_weights, self._weight_sums = _load_weights()
+        self._scorers = _load_scorers()
 
     def synthesize(
         self,
         layers: Dict[str, Dict],
         ticker: str,
         sector: Optional[str] = None,
-        industry: Optional[str] = None
-    ) -> Dict:
+        industry: Optional[str] = None,
+        verbose: bool = False
+    ) -> SynthesisResult:
         """
         Main synthesis function
 
@@ -56,101 +347,242 @@ class SynthesisEngine:
             ticker: Stock ticker
             sector: Company sector (for industry weights)
             industry: Company industry
+            verbose: Log the step-by-step report at INFO instead of DEBUG
 
         Returns:
-            Comprehensive synthesis with:
+            SynthesisResult with:
             - weighted_score: Industry-adjusted total score
             - conviction: high/medium/low/avoid/short
             - structural_overrides: List of disqualifying combinations
             - belief_state: Bayesian probability estimates
             - reasoning: Explanation of decision
         """
-        print(f"\n{'='*80}")
-        print(f"SYNTHESIS ENGINE: {ticker}")
-        print(f"{'='*80}\n")
+        view = LayerView.from_layers(layers)
 
         # Step 1: Get industry-specific weights
+        weights_key = self._weights_key(sector, industry)
         weights = self._get_weights(sector, industry)
-        print(f"Industry: {sector or 'Unknown'}")
-        print(f"Weights: {weights}\n")
 
-        # Step 2: Cross-layer structural reasoning
-        structural_analysis = self._analyze_structural_patterns(layers)
-        print("Structural Analysis:")
-        for key, value in structural_analysis.items():
-            if key == 'override_rules_triggered':
-                if value:
-                    print(f"  OVERRIDE RULES TRIGGERED:")
-                    for rule in value:
-                        print(f"    - {rule}")
+        # Step 3 (reported after the structural analysis): weighted score
+        weighted_score, score_breakdown = self._calculate_weighted_score(
+            view, weights, self._weight_sums[weights_key], self._scorers.get(weights_key)
+        )
+
+        return self._synthesize_scored(
+            view, ticker, sector, weights, weighted_score, score_breakdown, verbose
+        )
+
+    def synthesize_batch(
+        self,
+        layers_by_ticker: Dict[str, Dict[str, Dict]],
+        profiles: Optional[Dict[str, Tuple[Optional[str], Optional[str]]]] = None,
+        verbose: bool = False
+    ) -> Dict[str, SynthesisResult]:
+        """
+        Synthesize many tickers at once
+
+        Tickers are grouped by weight set. With numba, each group's weighted
+        scores and belief updates run in one parallel compiled kernel over an
+        (N, 7) score array; without it the weighted scores are accumulated
+        column by column with NumPy and beliefs run per ticker. Structural
+        reasoning and actions always run per ticker. Either way, results match
+        synthesize() exactly.
+
+        Args:
+            layers_by_ticker: {ticker: normalized layer outputs}
+            profiles: {ticker: (sector, industry)} used to pick industry weights
+            verbose: Log each ticker's report at INFO instead of DEBUG
+
+        Returns:
+            {ticker: SynthesisResult}, in input order
+        """
+        import numpy as np
+
+        profiles = profiles or {}
+        views = {ticker: LayerView.from_layers(layers) for ticker, layers in layers_by_ticker.items()}
+        structurals = {ticker: self._analyze_structural_patterns(view) for ticker, view in views.items()}
+
+        groups: Dict[str, List[str]] = {}
+        for ticker in layers_by_ticker:
+            key = self._weights_key(*profiles.get(ticker, (None, None)))
+            groups.setdefault(key, []).append(ticker)
+
+        scored = {}
+        for weights_key, tickers in groups.items():
+            weights = self.industry_weights.get(weights_key, self.default_weights)
+            # Missing layers score 0 and drop out of the weight sum
+            present = np.array(
+                [[key in views[t].flag_masks for key in _LAYER_KEYS] for t in tickers],
+                dtype=bool
+            )
+            scores = np.array(
+                [[views[t].score(key, 5) if key in views[t].flag_masks else 0
+                  for key in _LAYER_KEYS] for t in tickers],
+                dtype=np.float64
+            )
+            weight_vec = np.array([weights.get(key, 1.0) for key in _LAYER_KEYS], dtype=np.float64)
+
+            if HAS_NUMBA:
+                group_views = [views[t] for t in tickers]
+                out = np.empty((len(tickers), 4))
+                _synth_kernel(
+                    scores, present, weight_vec,
+                    np.array([v.risk_code('financial_truth') for v in group_views], dtype=np.int64),
+                    np.array([v.score('business_model', 5) for v in group_views], dtype=np.float64),
+                    np.array([v.traj_counts['improving'] for v in group_views], dtype=np.int64),
+                    np.array([v.traj_counts['deteriorating'] for v in group_views], dtype=np.int64),
+                    np.array([structurals[t]['disqualify'] for t in tickers], dtype=bool),
+                    out
+                )
+                normalized = out[:, 0]
+                beliefs = out[:, 1:].tolist()
             else:
-                print(f"  {key}: {value}")
+                # Accumulate column by column in _LAYER_KEYS order, like the
+                # per-ticker loop, so totals round identically (a BLAS dot
+                # product may sum in another order and move band edges);
+                # missing layers add exact zeros
+                weighted_total = np.zeros(len(tickers))
+                weight_sum = np.zeros(len(tickers))
+                for j in range(len(_LAYER_KEYS)):
+                    weighted_total += scores[:, j] * weight_vec[j]
+                    weight_sum += np.where(present[:, j], weight_vec[j], 0.0)
+                max_possible = 10 * weight_sum
+                scored_mask = max_possible > 0
+                normalized = np.full(len(tickers), 50.0)
+                normalized[scored_mask] = weighted_total[scored_mask] / max_possible[scored_mask] * 100
+                beliefs = [None] * len(tickers)
+
+            weight_list = weight_vec.tolist()
+            for i, ticker in enumerate(tickers):
+                view = views[ticker]
+                breakdown = {}
+                for key, weight in zip(_LAYER_KEYS, weight_list):
+                    if key in view.flag_masks:
+                        raw = view.score(key, 5)
+                        breakdown[key] = {'raw': raw, 'weight': weight, 'weighted': raw * weight}
+                belief_state = self._belief_state(*beliefs[i]) if beliefs[i] else None
+                scored[ticker] = (weights, float(normalized[i]), breakdown, belief_state)
+
+        results = {}
+        for ticker, view in views.items():
+            weights, weighted_score, breakdown, belief_state = scored[ticker]
+            results[ticker] = self._synthesize_scored(
+                view, ticker, profiles.get(ticker, (None, None))[0],
+                weights, weighted_score, breakdown, verbose,
+                structurals[ticker], belief_state
+            )
+        return results
 
-        # Step 3: Calculate weighted score
-        weighted_score, score_breakdown = self._calculate_weighted_score(layers, weights)
-        print(f"\nWeighted Score: {weighted_score:.1f}/100")
-        print("Score Breakdown:")
-        for layer, score_data in score_breakdown.items():
-            print(f"  {layer}: {score_data['raw']:.1f} × {score_data['weight']:.1f} = {score_data['weighted']:.1f}")
+    def _synthesize_scored(
+        self,
+        view: LayerView,
+        ticker: str,
+        sector: Optional[str],
+        weights: Mapping[str, float],
+        weighted_score: float,
+        score_breakdown: Dict,
+        verbose: bool,
+        structural_analysis: Optional[Dict] = None,
+        belief_state: Optional[Dict] = None
+    ) -> SynthesisResult:
+        """Structural reasoning, beliefs and action for an already weighted ticker"""
+        # The step-by-step report is logged at INFO when verbose, DEBUG otherwise;
+        # when that level is off none of it is formatted
+        level = logging.INFO if verbose else logging.DEBUG
+        report = logger.isEnabledFor(level)
+
+        if report:
+            logger.log(level, "\n%s\nSYNTHESIS ENGINE: %s\n%s\n", '=' * 80, ticker, '=' * 80)
+            logger.log(level, "Industry: %s", sector or 'Unknown')
+            logger.log(level, "Weights: %s\n", dict(weights))
+
+        # Step 2: Cross-layer structural reasoning
+        if structural_analysis is None:
+            structural_analysis = self._analyze_structural_patterns(view)
+        if report:
+            logger.log(level, "Structural Analysis:")
+            for key, value in structural_analysis.items():
+                if key == 'override_rules_triggered':
+                    if value:
+                        logger.log(level, "  OVERRIDE RULES TRIGGERED:")
+                        for rule in value:
+                            logger.log(level, "    - %s", rule)
+                else:
+                    logger.log(level, "  %s: %s", key, value)
+
+        # Step 3: Weighted score
+        if report:
+            logger.log(level, "\nWeighted Score: %.1f/100", weighted_score)
+            logger.log(level, "Score Breakdown:")
+            for layer, score_data in score_breakdown.items():
+                logger.log(level, "  %s: %.1f × %.1f = %.1f",
+                           layer, score_data['raw'], score_data['weight'], score_data['weighted'])
 
         # Step 4: Bayesian belief state
-        belief_state = self._compute_belief_state(layers, structural_analysis)
-        print(f"\nBelief State:")
-        print(f"  P(Structural Bull Case): {belief_state['bull_prob']:.1%}")
-        print(f"  P(Structural Bear Case): {belief_state['bear_prob']:.1%}")
-        print(f"  P(Distress Risk): {belief_state['distress_prob']:.1%}")
+        if belief_state is None:
+            belief_state = self._compute_belief_state(view, structural_analysis)
+        if report:
+            logger.log(level, "\nBelief State:")
+            logger.log(level, "  P(Structural Bull Case): %.1f%%", belief_state['bull_prob'] * 100)
+            logger.log(level, "  P(Structural Bear Case): %.1f%%", belief_state['bear_prob'] * 100)
+            logger.log(level, "  P(Distress Risk): %.1f%%", belief_state['distress_prob'] * 100)
 
         # Step 5: Determine conviction and action
         conviction, action, reasoning = self._determine_action(
             weighted_score,
             structural_analysis,
             belief_state,
-            layers
+            view
         )
 
-        print(f"\nConviction: {conviction}")
-        print(f"Action: {action}")
-        print(f"Reasoning: {reasoning}\n")
-
-        return {
-            'ticker': ticker,
-            'weighted_score': round(weighted_score, 2),
-            'raw_score': sum(l.get('score', 5) for l in layers.values()),
-            'conviction': conviction,
-            'action': action,
-            'reasoning': reasoning,
-            'weights_used': weights,
-            'score_breakdown': score_breakdown,
-            'structural_analysis': structural_analysis,
-            'belief_state': belief_state,
-            'disqualified': structural_analysis.get('disqualify', False),
-            'override_rules': structural_analysis.get('override_rules_triggered', [])
-        }
+        if report:
+            logger.log(level, "\nConviction: %s", conviction)
+            logger.log(level, "Action: %s", action)
+            logger.log(level, "Reasoning: %s\n", reasoning)
+
+        return SynthesisResult(
+            ticker=ticker,
+            weighted_score=round(weighted_score, 2),
+            raw_score=view.raw_total,
+            conviction=conviction,
+            action=action,
+            reasoning=reasoning,
+            weights_used=dict(weights),
+            score_breakdown=score_breakdown,
+            structural_analysis=structural_analysis,
+            belief_state=belief_state,
+            disqualified=structural_analysis.get('disqualify', False),
+            override_rules=structural_analysis.get('override_rules_triggered', [])
+        )
 
-    def _get_weights(self, sector: Optional[str], industry: Optional[str]) -> Dict[str, float]:
+    def _weights_key(self, sector: Optional[str], industry: Optional[str]) -> str:
         """
-        Get industry-specific weights
+        Get the weight-set key
 
         Prefers industry, falls back to sector, then default
         """
         # Try industry first (more specific)
-        if industry and industry in self.industry_weights:
-            return {k: v for k, v in self.industry_weights[industry].items() if not k.startswith('_')}
+        if industry in self.industry_weights:
+            return industry
 
         # Try sector
-        if sector and sector in self.industry_weights:
-            return {k: v for k, v in self.industry_weights[sector].items() if not k.startswith('_')}
+        if sector in self.industry_weights:
+            return sector
 
         # Default
-        return self.default_weights
+        return DEFAULT_WEIGHTS_KEY
 
-    def _analyze_structural_patterns(self, layers: Dict[str, Dict]) -> Dict:
+    def _get_weights(self, sector: Optional[str], industry: Optional[str]) -> Mapping[str, float]:
+        """Get industry-specific weights"""
+        return self.industry_weights.get(self._weights_key(sector, industry), self.default_weights)
+
+    def _analyze_structural_patterns(self, view: LayerView) -> Dict:
         """
         Cross-Layer Structural Reasoning
 
         This is where the magic happens. Layers inform each other.
 
-        Override Rules (immediate disqualification):
+        Override Rules (immediate disqualification, first match wins):
         1. Financial distress + Management selling = AVOID
         2. Declining revenue + Deteriorating financials = SHORT_CANDIDATE
         3. Negative FCF + High debt = DISTRESS_RISK
@@ -169,84 +601,73 @@ class SynthesisEngine:
         }
 
         # Extract layer states
-        business = layers.get('business_model', {})
-        financial = layers.get('financial_truth', {})
-        management = layers.get('management', {})
-        competitive = layers.get('competitive', {})
-        risk = layers.get('risk', {})
+        biz_mask = view.flag_masks.get('business_model', 0)
+        fin_mask = view.flag_masks.get('financial_truth', 0)
+        mgmt_mask = view.flag_masks.get('management', 0)
+        fin_risk = view.risk_code('financial_truth')
+        fin_trajectory = view.trajectories.get('financial_truth')
+        biz_score = view.score('business_model', 0)
 
         # CRITICAL OVERRIDE RULES
+        # Checked in a fixed order; the first match disqualifies and the rest
+        # are skipped, so the same canonical rule is always the one reported.
 
         # Rule 1: Financial Distress + Insider Selling = AVOID
-        if (financial.get('risk_level') in ['critical', 'high'] and
-            'NEGATIVE_FREE_CASH_FLOW' in financial.get('risk_flags', [])):
-
-            if 'INSIDER_HEAVY_SELLING' in management.get('risk_flags', []):
-                analysis['disqualify'] = True
-                analysis['override_rules_triggered'].append(
-                    "FINANCIAL_DISTRESS + INSIDER_SELLING = Management bailing before bankruptcy"
-                )
+        if fin_risk >= _HIGH_RISK and fin_mask & _NEG_FCF and mgmt_mask & _INSIDER_SELL:
+            disqualifier = "FINANCIAL_DISTRESS + INSIDER_SELLING = Management bailing before bankruptcy"
 
         # Rule 2: Declining Revenue + Deteriorating Cash = Terminal Decline
-        if ('DECLINING_REVENUE' in business.get('risk_flags', []) and
-            'REVENUE_UP_CASH_DOWN' in financial.get('risk_flags', [])):
-            analysis['disqualify'] = True
-            analysis['override_rules_triggered'].append(
-                "DECLINING_REVENUE + CASH_FLOW_DETERIORATION = Business dying"
-            )
+        elif biz_mask & _DECLINING_REV and fin_mask & _REV_UP_CASH_DOWN:
+            disqualifier = "DECLINING_REVENUE + CASH_FLOW_DETERIORATION = Business dying"
 
         # Rule 3: Negative FCF + High Debt = Bankruptcy Risk
-        if ('NEGATIVE_FREE_CASH_FLOW' in financial.get('risk_flags', []) and
-            'HIGH_DEBT_TO_EBITDA' in financial.get('risk_flags', [])):
-            analysis['disqualify'] = True
-            analysis['override_rules_triggered'].append(
-                "NEGATIVE_FCF + HIGH_DEBT = Cannot service debt, distress imminent"
-            )
+        elif fin_mask & (_NEG_FCF | _HIGH_DEBT) == _NEG_FCF | _HIGH_DEBT:
+            disqualifier = "NEGATIVE_FCF + HIGH_DEBT = Cannot service debt, distress imminent"
 
         # Rule 4: Low Interest Coverage + Rising Debt = Spiral
-        if ('LOW_INTEREST_COVERAGE' in financial.get('risk_flags', []) and
-            financial.get('trajectory') == 'deteriorating'):
+        elif fin_mask & _LOW_COVERAGE and fin_trajectory == 'deteriorating':
+            disqualifier = "LOW_COVERAGE + DETERIORATING = Death spiral beginning"
+
+        else:
+            disqualifier = None
+
+        if disqualifier:
             analysis['disqualify'] = True
-            analysis['override_rules_triggered'].append(
-                "LOW_COVERAGE + DETERIORATING = Death spiral beginning"
-            )
+            analysis['override_rules_triggered'].append(disqualifier)
 
         # Rule 5: Competitive Collapse + Margin Compression = Avoid
-        if (competitive.get('risk_level') in ['high', 'critical'] and
-            'LOW_MARGINS' in business.get('risk_flags', [])):
+        if view.risk_code('competitive') >= _HIGH_RISK and biz_mask & _LOW_MARGINS:
             analysis['override_rules_triggered'].append(
                 "COMPETITIVE_PRESSURE + LOW_MARGINS = No moat, commodity pricing"
             )
 
         # AMPLIFICATION RULES (positive reinforcement)
-
-        # Strong business model + Strong financials = High conviction
-        if (business.get('score', 0) >= 7 and
-            financial.get('score', 0) >= 7):
-            analysis['amplify'] = True
-            analysis['pattern_matches'].append('STRONG_FUNDAMENTALS')
-
-        # Everything improving = Momentum
-        trajectories = [layer.get('trajectory') for layer in layers.values()]
-        improving_count = trajectories.count('improving')
-        deteriorating_count = trajectories.count('deteriorating')
-
-        if improving_count >= 3 and deteriorating_count == 0:
-            analysis['amplify'] = True
-            analysis['pattern_matches'].append('BROAD_IMPROVEMENT')
-
-        # Strong moat + High margins + Growing = Compounder
-        if (business.get('score', 0) >= 8 and
-            financial.get('trajectory') == 'improving'):
-            analysis['pattern_matches'].append('COMPOUNDER_PROFILE')
+        # Skipped for disqualified tickers: _determine_action never reads them there
+        if not analysis['disqualify']:
+            # Strong business model + Strong financials = High conviction
+            if biz_score >= 7 and view.score('financial_truth', 0) >= 7:
+                analysis['amplify'] = True
+                analysis['pattern_matches'].append('STRONG_FUNDAMENTALS')
+
+            # Everything improving = Momentum
+            if view.traj_counts['improving'] >= 3 and view.traj_counts['deteriorating'] == 0:
+                analysis['amplify'] = True
+                analysis['pattern_matches'].append('BROAD_IMPROVEMENT')
+
+            # Strong moat + High margins + Growing = Compounder
+            if biz_score >= 8 and fin_trajectory == 'improving':
+                analysis['pattern_matches'].append('COMPOUNDER_PROFILE')
 
         # Cross-layer consistency check
-        scores = [layer.get('score', 5) for layer in layers.values() if 'score' in layer]
+        scores = list(view.scores.values())
         if scores:
-            score_std = np.std(scores)
-            if score_std < 2:  # Low variance = consistency
+            # Population variance against squared thresholds (std 2 -> 4, std 4 -> 16)
+            n = len(scores)
+            mean = sum(scores) / n
+            score_var = sum((s - mean) * (s - mean) for s in scores) / n
+            if score_var < 4:  # Low variance = consistency
                 analysis['cross_layer_signals']['consistency'] = 'HIGH'
-            elif score_std > 4:  # High variance = conflict
+            elif score_var > 16:  # High variance = conflict
                 analysis['cross_layer_signals']['consistency'] = 'CONFLICTING'
                 analysis['pattern_matches'].append('MIXED_SIGNALS')
 
@@ -254,8 +675,10 @@ class SynthesisEngine:
 
     def _calculate_weighted_score(
         self,
-        layers: Dict[str, Dict],
-        weights: Dict[str, float]
+        view: LayerView,
+        weights: Mapping[str, float],
+        weight_sum: Optional[float] = None,
+        scorer: Optional[Callable] = None
     ) -> Tuple[float, Dict]:
         """
         Industry-weighted scoring
@@ -263,39 +686,37 @@ class SynthesisEngine:
         Not all layers matter equally for all industries.
         Software: Business model matters 4x more than debt
         Banks: Balance sheet matters 4x more than competitive moat
+
+        weight_sum is the precomputed total of all seven layer weights; when a
+        layer is missing the present layers' weights are summed instead.
+        scorer is the weight set's generated scorer, used when all seven
+        layers are present.
         """
+        if scorer is not None and view.flag_masks.keys() >= _LAYER_KEY_SET:
+            return scorer(view.scores.get)
+
         weighted_total = 0
-        weight_sum = 0
         breakdown = {}
 
-        layer_mapping = {
-            'business_model': 'business_model',
-            'financial_truth': 'financial_truth',
-            'management': 'management',
-            'market_structure': 'market_structure',
-            'competitive': 'competitive',
-            'macro': 'macro',
-            'risk': 'risk'
-        }
-
-        for layer_key, weight_key in layer_mapping.items():
-            if layer_key in layers:
-                layer_data = layers[layer_key]
-                raw_score = layer_data.get('score', 5)
-                weight = weights.get(weight_key, 1.0)
+        for key in _LAYER_KEYS:
+            if key not in view.flag_masks:
+                continue
+            raw_score = view.score(key, 5)
+            weight = weights.get(key, 1.0)
 
-                weighted_score = raw_score * weight
-                weighted_total += weighted_score
-                weight_sum += weight
+            weighted_score = raw_score * weight
+            weighted_total += weighted_score
 
-                breakdown[layer_key] = {
-                    'raw': raw_score,
-                    'weight': weight,
-                    'weighted': weighted_score
-                }
+            breakdown[key] = {
+                'raw': raw_score,
+                'weight': weight,
+                'weighted': weighted_score
+            }
 
         # Normalize to 0-100 scale
         # Max possible = 10 * sum(weights)
+        if weight_sum is None or len(breakdown) < len(_LAYER_KEYS):
+            weight_sum = sum(entry['weight'] for entry in breakdown.values())
         max_possible = 10 * weight_sum
         normalized_score = (weighted_total / max_possible) * 100 if max_possible > 0 else 50
 
@@ -303,7 +724,7 @@ class SynthesisEngine:
 
     def _compute_belief_state(
         self,
-        layers: Dict[str, Dict],
+        view: LayerView,
         structural_analysis: Dict
     ) -> Dict:
         """
@@ -314,57 +735,23 @@ class SynthesisEngine:
         - P(Structural Bear Case) = Avoid or short
         - P(Distress) = Bankruptcy risk
         """
-        # Start with priors (base rates)
-        bull_prob = 0.3  # 30% of stocks are long-term winners
-        bear_prob = 0.2  # 20% are structural shorts
-        distress_prob = 0.05  # 5% face bankruptcy
-
-        # Update based on layer evidence
-
-        # Financial layer updates distress probability
-        financial = layers.get('financial_truth', {})
-        if financial.get('risk_level') == 'critical':
-            distress_prob *= 5  # 25% distress risk
-        elif financial.get('risk_level') == 'high':
-            distress_prob *= 3  # 15% distress risk
-
-        # Business model updates bull probability
-        business = layers.get('business_model', {})
-        if business.get('score', 5) >= 8:
-            bull_prob *= 2  # 60% if strong business
-        elif business.get('score', 5) <= 3:
-            bull_prob *= 0.3  # 9% if weak business
-            bear_prob *= 2  # 40% bear case
-
-        # Trajectory matters
-        trajectories = [layer.get('trajectory') for layer in layers.values()]
-        improving_count = trajectories.count('improving')
-        deteriorating_count = trajectories.count('deteriorating')
-
-        if improving_count >= 3:
-            bull_prob *= 1.5
-        if deteriorating_count >= 3:
-            bear_prob *= 2
-            distress_prob *= 1.5
-
-        # Structural overrides force probabilities
-        if structural_analysis.get('disqualify'):
-            bull_prob = 0.05
-            bear_prob = 0.7
-            distress_prob = min(distress_prob * 2, 0.5)
-
-        # Normalize probabilities
-        total = bull_prob + bear_prob + distress_prob
-        if total > 1:
-            bull_prob /= total
-            bear_prob /= total
-            distress_prob /= total
+        bull_prob, bear_prob, distress_prob = _belief_core(
+            view.risk_code('financial_truth'),
+            view.score('business_model', 5),
+            view.traj_counts['improving'],
+            view.traj_counts['deteriorating'],
+            bool(structural_analysis.get('disqualify'))
+        )
+        return self._belief_state(bull_prob, bear_prob, distress_prob)
 
+    @staticmethod
+    def _belief_state(bull_prob: float, bear_prob: float, distress_prob: float) -> Dict:
+        """Belief probabilities as returned in the synthesis"""
         return {
             'bull_prob': bull_prob,
             'bear_prob': bear_prob,
             'distress_prob': distress_prob,
-            'neutral_prob': 1 - bull_prob - bear_prob - distress_prob
+            'neutral_prob': max(0.0, 1.0 - bull_prob - bear_prob - distress_prob)
         }
 
     def _determine_action(
@@ -372,7 +759,7 @@ class SynthesisEngine:
         weighted_score: float,
         structural_analysis: Dict,
         belief_state: Dict,
-        layers: Dict
+        view: LayerView
     ) -> Tuple[str, str, str]:
         """
         Determine conviction level and action
@@ -415,46 +802,23 @@ class SynthesisEngine:
                 f"Structural bear case ({belief_state['bear_prob']:.0%} probability)"
             )
 
-        # Bull cases
-        if belief_state['bull_prob'] > 0.6 and weighted_score >= 70:
-            reasoning = f"High conviction structural winner (P={belief_state['bull_prob']:.0%}, Score={weighted_score:.0f})"
-            if structural_analysis.get('amplify'):
-                reasoning += f" | Amplified by: {', '.join(structural_analysis['pattern_matches'])}"
-            return ('HIGH', 'BUY_HIGH_CONVICTION', reasoning)
-
-        if weighted_score >= 65:
-            return (
-                'MEDIUM',
-                'BUY_MEDIUM',
-                f"Solid setup (Score={weighted_score:.0f}, Bull P={belief_state['bull_prob']:.0%})"
-            )
-
-        if weighted_score >= 55:
-            return (
-                'LOW',
-                'TRADE_ONLY',
-                f"Marginal case (Score={weighted_score:.0f}), short-term only"
-            )
-
-        if weighted_score >= 40:
-            return (
-                'AVOID',
-                'SPECULATION_ONLY',
-                f"Weak case (Score={weighted_score:.0f}), too many red flags"
-            )
-
-        # Below 40 = avoid
-        return (
-            'AVOID',
-            'DO_NOT_TRADE',
-            f"Poor fundamentals (Score={weighted_score:.0f})"
-        )
+        # Score bands, highest first
+        band = bisect.bisect_right(_ACTION_THRESHOLDS, weighted_score)
+        if band == _HIGH_BAND and belief_state['bull_prob'] <= 0.6:
+            band -= 1
 
+        conviction, action, template = _ACTION_BANDS[band]
+        reasoning = template.format(score=weighted_score, bull=belief_state['bull_prob'])
+        if band == _HIGH_BAND and structural_analysis.get('amplify'):
+            reasoning += f" | Amplified by: {', '.join(structural_analysis['pattern_matches'])}"
+        return (conviction, action, reasoning)
 
 def main():
     """Test the synthesis engine"""
     from market_truth.core.layer_schema import LayerOutput
 
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     # Mock layer outputs
     test_layers = {
         'business_model': LayerOutput.normalize({
@@ -484,13 +848,14 @@ def main():
         layers=test_layers,
         ticker='TEST',
         sector='Technology',
-        industry='Software'
+        industry='Software',
+        verbose=True
     )
 
     print(f"\n{'='*80}")
     print(f"SYNTHESIS RESULT")
     print(f"{'='*80}\n")
-    print(json.dumps(result, indent=2, default=str))
+    print(json.dumps(result.to_dict(), indent=2, default=str))
 
 
 if __name__ == "__main__":
@@ -9,13 +9,46 @@ Key Insight: The direction matters as much as the level.
 - Red flags disappearing = recovery
 
 Storage: cache/ticker_history/{ticker}.json
+Score log (with pyarrow): cache/ticker_history/_score_log/date={YYYY-MM-DD}/*.parquet
 """
 import json
 import os
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# History files are rewritten on every save; orjson encodes them several times faster
+_ORJSON_OPTIONS = (
+    (orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    if HAS_ORJSON else 0
+)
+
+
+# Each save writes one small file; a date partition is merged into a single
+# file once it holds this many
+SCORE_LOG_COMPACT_FILES = 64
+
+
+def ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Local datetime for an epoch-nanosecond timestamp (e.g. analysis['timestamp_ns'])"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9)
+
 
 class TemporalEngine:
     """
@@ -43,6 +76,94 @@ class TemporalEngine:
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # Columnar per-layer score log, partitioned by date
+        self.score_log_dir = self.cache_dir / "_score_log"
+        # analyze_many saves from worker threads; one compaction per engine at a time
+        self._score_log_lock = threading.Lock()
+
+    @staticmethod
+    def _load_history(history_file: Path) -> Dict:
+        """Read a ticker's history file"""
+        if HAS_ORJSON:
+            with open(history_file, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(history_file, 'r') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_history(history_file: Path, history: Dict) -> None:
+        """Write a ticker's history file"""
+        if HAS_ORJSON:
+            with open(history_file, 'wb') as f:
+                f.write(orjson.dumps(history, default=str, option=_ORJSON_OPTIONS))
+        else:
+            with open(history_file, 'w') as f:
+                json.dump(history, f, indent=2, default=str)
+
+    def _append_score_log(self, ticker: str, timestamp_ns: int, layers: Dict) -> None:
+        """Append one row per layer to the analysis date's score log partition"""
+        names = list(layers)
+        table = pa.table({
+            'ticker': [ticker] * len(names),
+            'timestamp_ns': [timestamp_ns] * len(names),
+            'layer': names,
+            'score': [float(layers[n].get('score', 0) or 0) for n in names],
+            'normalized_score': [layers[n].get('normalized_score') for n in names],
+            'risk_level': [layers[n].get('risk_level', 'unknown') for n in names],
+            'trajectory': [layers[n].get('trajectory', 'unknown') for n in names]
+        }, schema=pa.schema([
+            ('ticker', pa.string()),
+            ('timestamp_ns', pa.int64()),
+            ('layer', pa.string()),
+            ('score', pa.float64()),
+            ('normalized_score', pa.float64()),
+            ('risk_level', pa.string()),
+            ('trajectory', pa.string())
+        ]))
+
+        partition = self.score_log_dir / f"date={ns_to_datetime(timestamp_ns).date().isoformat()}"
+        partition.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, partition / f"{ticker}-{timestamp_ns}.parquet")
+
+        with self._score_log_lock:
+            files = sorted(partition.glob('*.parquet'))
+            if len(files) >= SCORE_LOG_COMPACT_FILES:
+                self._compact_partition(partition, files)
+
+    @staticmethod
+    def _compact_partition(partition: Path, files: List[Path]) -> None:
+        """Merge a date partition's score log files into one file"""
+        table = pa.concat_tables([pq.ParquetFile(f).read() for f in files])
+
+        # Dot-prefixed files are ignored by dataset discovery until the rename
+        stamp = time.time_ns()
+        tmp = partition / f".compact-{stamp}.tmp"
+        pq.write_table(table, tmp)
+        os.replace(tmp, partition / f"compact-{stamp}.parquet")
+        for f in files:
+            f.unlink(missing_ok=True)
+
+    def compact_score_log(self) -> int:
+        """
+        Merge every score log partition that holds more than one file
+
+        Saves compact the current day automatically; this also covers
+        older partitions.
+
+        Returns number of partitions compacted
+        """
+        if not HAS_PYARROW or not self.score_log_dir.exists():
+            return 0
+
+        compacted = 0
+        with self._score_log_lock:
+            for partition in self.score_log_dir.glob('date=*'):
+                files = sorted(partition.glob('*.parquet'))
+                if len(files) > 1:
+                    self._compact_partition(partition, files)
+                    compacted += 1
+        return compacted
+
     def save_analysis(
         self,
         ticker: str,
@@ -61,8 +182,7 @@ class TemporalEngine:
 
         # Load existing history
         if history_file.exists():
-            with open(history_file, 'r') as f:
-                history = json.load(f)
+            history = self._load_history(history_file)
         else:
             history = {
                 'ticker': ticker,
@@ -70,9 +190,11 @@ class TemporalEngine:
                 'analyses': []
             }
 
-        # Create snapshot
+        # Create snapshot, stamped with the analysis' own run time when it has one
+        timestamp_ns = analysis.get('timestamp_ns') or time.time_ns()
         snapshot = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': ns_to_datetime(timestamp_ns).isoformat(),
+            'timestamp_ns': timestamp_ns,
             'layers': {},
             'synthesis': synthesis,
             'metadata': {
@@ -96,11 +218,52 @@ class TemporalEngine:
         history['last_updated'] = datetime.now().isoformat()
 
         # Save
-        with open(history_file, 'w') as f:
-            json.dump(history, f, indent=2, default=str)
+        self._write_history(history_file, history)
+
+        if HAS_PYARROW:
+            self._append_score_log(
+                ticker,
+                timestamp_ns,
+                analysis.get('layers_normalized') or analysis.get('layers', {})
+            )
 
         print(f"[Temporal] Saved analysis snapshot for {ticker}")
 
+    def load_score_log(
+        self,
+        tickers: Optional[List[str]] = None,
+        since: Optional[str] = None
+    ):
+        """
+        Query the per-layer score log across tickers (requires pyarrow)
+
+        Args:
+            tickers: Only these tickers (default: all)
+            since: Only partitions on or after this YYYY-MM-DD date
+
+        Returns:
+            DataFrame with one row per layer per saved analysis,
+            None if pyarrow is missing or nothing has been logged
+        """
+        if not HAS_PYARROW or not self.score_log_dir.exists():
+            return None
+
+        dataset = ds.dataset(
+            self.score_log_dir,
+            format='parquet',
+            partitioning=ds.partitioning(pa.schema([('date', pa.string())]), flavor='hive')
+        )
+
+        # Filters are pushed down, so unmatched partitions and row groups are never read
+        condition = None
+        if tickers:
+            condition = ds.field('ticker').isin(list(tickers))
+        if since:
+            since_filter = ds.field('date') >= since
+            condition = since_filter if condition is None else condition & since_filter
+
+        return dataset.to_table(filter=condition).to_pandas()
+
     def get_temporal_analysis(self, ticker: str) -> Optional[Dict]:
         """
         Analyze changes over time for a ticker
@@ -114,8 +277,7 @@ class TemporalEngine:
         if not history_file.exists():
             return None
 
-        with open(history_file, 'r') as f:
-            history = json.load(f)
+        history = self._load_history(history_file)
 
         if len(history['analyses']) < 2:
             return {
@@ -326,8 +488,7 @@ class TemporalEngine:
         if not history_file.exists():
             return None
 
-        with open(history_file, 'r') as f:
-            history = json.load(f)
+        history = self._load_history(history_file)
 
         analyses = history.get('analyses', [])
 
@@ -65,9 +65,10 @@ def example_3_check_temporal_changes():
     analysis1 = mtf.analyze('NVDA')
     print(f"  Score: {analysis1['synthesis']['weighted_score']:.1f}")
 
-    # Run again (in real usage, this would be days/weeks later)
+    # Run again (in real usage, this would be days/weeks later); skip the
+    # same-day analysis cache so this is a fresh snapshot
     print("\nSecond analysis (compares to baseline):")
-    analysis2 = mtf.analyze('NVDA')
+    analysis2 = mtf.analyze('NVDA', use_cache=False)
 
     if analysis2.get('temporal'):
         temporal = analysis2['temporal']
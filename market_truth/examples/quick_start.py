@@ -122,7 +122,7 @@ def main():
         print("="*80)
         print("\nNext steps:")
         print("  1. Analyze a stock:")
-        print("     python core/framework.py TICKER")
+        print("     python -m market_truth.core.framework TICKER")
         print("\n  2. See examples:")
         print("     python examples/basic_usage.py")
         print("\n  3. Read documentation:")